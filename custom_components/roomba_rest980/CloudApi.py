@@ -3,26 +3,68 @@
 Based on reverse engineering of the iRobot mobile app.
 """
 
+import asyncio
 from datetime import UTC, datetime
+import functools
 import hashlib
 import hmac
 import json
 from json.decoder import JSONDecodeError
 import logging
 from pathlib import Path
-from typing import Any
+import string
+from typing import Any, NamedTuple
 import urllib.parse
 import uuid
 
-import aiofiles
 import aiohttp
 
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson ships with Home Assistant, stdlib outside of it
+    json_loads = json.loads
+
 _LOGGER = logging.getLogger(__name__)
 
 # Debug: Save UMF data to file for analysis
 DEBUG_SAVE_UMF = False
 DEBUG_UMF_PATH = Path("/workspaces/ha-core/config/debug_umf_data.json")
 
+_AWS4_REQUEST = b"aws4_request"
+# Characters SigV4 leaves unencoded in the canonical query string
+_UNRESERVED = frozenset(string.ascii_letters + string.digits + "-_.~")
+
+PMAPS_PARAMS = {"visible": "true", "activeDetails": "2"}
+PMAP_UMF_PARAMS = {"activeDetails": "2"}
+
+AWS_REQUEST_HEADERS = {
+    "accept": "application/json",
+    "content-type": "application/json",
+    "user-agent": "aws-sdk-iOS/2.27.6 iOS/18.0.1 en_US",
+}
+
+
+def _quote_unreserved(value: str) -> str:
+    """Percent-encode a query component, skipping quote() for clean values."""
+    if _UNRESERVED.issuperset(value):
+        return value
+    return urllib.parse.quote(value, safe="~")
+
+
+@functools.lru_cache(maxsize=32)
+def _canonical_query(items: tuple[tuple[str, Any], ...]) -> str:
+    """Build a SigV4 canonical query string, cached as the parameter sets are fixed."""
+    return "&".join(
+        f"{_quote_unreserved(key)}={_quote_unreserved(str(value))}"
+        for key, value in sorted(items)
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _encode_query(items: tuple[tuple[str, Any], ...]) -> str:
+    """URL encode query parameters, cached as the parameter sets are fixed."""
+    return urllib.parse.urlencode(items)
+
 
 class CloudApiError(Exception):
     """Custom exception for Cloud API errors."""
@@ -32,9 +74,22 @@ class AuthenticationError(CloudApiError):
     """Authentication related errors."""
 
 
+class SigningTemplate(NamedTuple):
+    """Precomputed canonical header data for a fixed set of extra headers."""
+
+    headers: dict[str, str]
+    signed_headers: str
+    canonical_headers: str
+
+
 class AWSSignatureV4:
     """AWS Signature Version 4 implementation for signing requests."""
 
+    ALGORITHM = "AWS4-HMAC-SHA256"
+    EMPTY_PAYLOAD_SHA256 = (
+        "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855"
+    )
+
     def __init__(
         self,
         access_key_id: str,
@@ -45,30 +100,65 @@ class AWSSignatureV4:
         self.access_key_id = access_key_id
         self.secret_access_key = secret_access_key
         self.session_token = session_token
+        self._secret_prefix = f"AWS4{secret_access_key}".encode()
+        # Derived signing keys only change with the date, region or service
+        self._key_cache: dict[tuple[str, str, str], bytes] = {}
 
-    def _hmac_sha256(self, key: bytes, data: str) -> bytes:
+    def _hmac_sha256(self, key: bytes, data: bytes) -> bytes:
         """HMAC SHA256 helper."""
-        return hmac.new(key, data.encode("utf-8"), hashlib.sha256).digest()
+        return hmac.digest(key, data, "sha256")
 
-    def _sha256_hex(self, data: str) -> str:
+    def _sha256_hex(self, data: bytes) -> str:
         """SHA256 hex helper."""
-        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+        return hashlib.sha256(data).hexdigest()
 
     def _get_signature_key(self, date_stamp: str, region: str, service: str) -> bytes:
         """Generate AWS Signature V4 signing key."""
-        k_date = self._hmac_sha256(f"AWS4{self.secret_access_key}".encode(), date_stamp)
-        k_region = self._hmac_sha256(k_date, region)
-        k_service = self._hmac_sha256(k_region, service)
-        return self._hmac_sha256(k_service, "aws4_request")
+        cache_key = (date_stamp, region, service)
+        if (signing_key := self._key_cache.get(cache_key)) is not None:
+            return signing_key
+
+        k_date = self._hmac_sha256(self._secret_prefix, date_stamp.encode())
+        k_region = self._hmac_sha256(k_date, region.encode())
+        k_service = self._hmac_sha256(k_region, service.encode())
+        signing_key = self._hmac_sha256(k_service, _AWS4_REQUEST)
 
-    def _get_date_stamp(self, date: datetime) -> str:
-        """Generate date stamp YYYYMMDD."""
-        return date.strftime("%Y%m%d")
+        # Only the most recent key is useful, the date stamp rolls over daily
+        self._key_cache.clear()
+        self._key_cache[cache_key] = signing_key
+        return signing_key
+
+    def _get_date_stamp(self, amz_date: str) -> str:
+        """Generate date stamp YYYYMMDD from an x-amz-date value."""
+        return amz_date[:8]
 
     def _get_amz_date(self, date: datetime) -> str:
         """Generate x-amz-date YYYYMMDD'T'HHMMSS'Z'."""
         return date.strftime("%Y%m%dT%H%M%SZ")
 
+    @staticmethod
+    def prepare_template(headers: dict[str, str]) -> SigningTemplate:
+        """Precompute the sorted canonical headers for a fixed header set.
+
+        Only host and x-amz-date are left to be filled in per request.
+        """
+        lowered = {k.lower(): v for k, v in headers.items()}
+        # host and x-amz-date become format fields, static values are escaped
+        fields = {
+            k: v.replace("{", "{{").replace("}", "}}") for k, v in lowered.items()
+        }
+        fields["host"] = "{host}"
+        fields["x-amz-date"] = "{x_amz_date}"
+        sorted_header_keys = sorted(fields)
+        canonical_headers = "".join(
+            f"{key}:{fields[key]}\n" for key in sorted_header_keys
+        )
+        return SigningTemplate(
+            headers=lowered,
+            signed_headers=";".join(sorted_header_keys),
+            canonical_headers=canonical_headers,
+        )
+
     def generate_signed_headers(
         self,
         method: str,
@@ -79,8 +169,13 @@ class AWSSignatureV4:
         query_params: dict[str, Any] | None = None,
         headers: dict[str, str] | None = None,
         payload: str = "",
+        template: SigningTemplate | None = None,
     ) -> dict[str, str]:
-        """Generate AWS SigV4 signed headers for a request."""
+        """Generate AWS SigV4 signed headers for a request.
+
+        When a template from prepare_template is given, its headers are used
+        in place of headers and the canonical header block is not rebuilt.
+        """
         if query_params is None:
             query_params = {}
         if headers is None:
@@ -88,7 +183,7 @@ class AWSSignatureV4:
 
         now = datetime.now(tz=UTC)
         amz_date = self._get_amz_date(now)
-        date_stamp = self._get_date_stamp(now)
+        date_stamp = self._get_date_stamp(amz_date)
 
         # Step 1: HTTP Method
         http_method = method.upper()
@@ -97,34 +192,43 @@ class AWSSignatureV4:
         canonical_uri = urllib.parse.quote(path, safe="/")
 
         # Step 3: Canonical Query String
-        sorted_query_keys = sorted(query_params.keys())
-        canonical_query_string = "&".join(
-            [
-                f"{urllib.parse.quote(key, safe='~')}={urllib.parse.quote(str(query_params[key]), safe='~')}"
-                for key in sorted_query_keys
-            ]
-        )
+        canonical_query_string = _canonical_query(tuple(query_params.items()))
 
         # Step 4: Canonical Headers
-        merged_headers = {"host": host, "x-amz-date": amz_date, **headers}
+        if template is not None:
+            merged_headers = {"host": host, "x-amz-date": amz_date, **template.headers}
+            canonical_headers = template.canonical_headers.format(
+                host=host, x_amz_date=amz_date
+            )
+            signed_headers = template.signed_headers
+        else:
+            merged_headers = {"host": host, "x-amz-date": amz_date, **headers}
 
-        sorted_header_keys = sorted([k.lower() for k in merged_headers])
-        canonical_headers = (
-            "\n".join([f"{key}:{merged_headers[key]}" for key in sorted_header_keys])
-            + "\n"
-        )
-        signed_headers = ";".join(sorted_header_keys)
+            sorted_header_keys = sorted([k.lower() for k in merged_headers])
+            canonical_headers = (
+                "\n".join(
+                    [f"{key}:{merged_headers[key]}" for key in sorted_header_keys]
+                )
+                + "\n"
+            )
+            signed_headers = ";".join(sorted_header_keys)
 
         # Step 5: Payload hash
-        payload_hash = self._sha256_hex(payload)
+        payload_hash = (
+            self._sha256_hex(payload.encode("utf-8"))
+            if payload
+            else self.EMPTY_PAYLOAD_SHA256
+        )
 
         # Step 6: Canonical request
         canonical_request = f"{http_method}\n{canonical_uri}\n{canonical_query_string}\n{canonical_headers}\n{signed_headers}\n{payload_hash}"
 
         # Step 7: String to sign
-        algorithm = "AWS4-HMAC-SHA256"
+        algorithm = self.ALGORITHM
         credential_scope = f"{date_stamp}/{region}/{service}/aws4_request"
-        canonical_request_hash = self._sha256_hex(canonical_request)
+        canonical_request_hash = hashlib.sha256(
+            canonical_request.encode("utf-8")
+        ).hexdigest()
 
         string_to_sign = (
             f"{algorithm}\n{amz_date}\n{credential_scope}\n{canonical_request_hash}"
@@ -132,9 +236,9 @@ class AWSSignatureV4:
 
         # Step 8: Calculate signature
         signing_key = self._get_signature_key(date_stamp, region, service)
-        signature = hmac.new(
-            signing_key, string_to_sign.encode("utf-8"), hashlib.sha256
-        ).hexdigest()
+        signature = self._hmac_sha256(
+            signing_key, string_to_sign.encode("utf-8")
+        ).hex()
 
         # Step 9: Authorization header
         authorization_header = f"{algorithm} Credential={self.access_key_id}/{credential_scope}, SignedHeaders={signed_headers}, Signature={signature}"
@@ -159,11 +263,24 @@ class iRobotCloudApi:
         """Initialize iRobot Cloud API client with credentials."""
         self.username = username
         self.password = password
-        self.session = session or aiohttp.ClientSession()
-        self._should_close_session = session is None
+        if session is None:
+            # Only the config flow's login creates its own session
+            session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=30, connect=5)
+            )
+            self._should_close_session = True
+        else:
+            self._should_close_session = False
+        self.session = session
 
         # Configuration
         self.config = {"appId": str(uuid.uuid4()), "deviceId": str(uuid.uuid4())}
+        self._app_id = f"IOS-{self.config['appId']}"
+        self._mission_history_params = {
+            "app_id": self._app_id,
+            "filterType": "omit_quickly_canceled_not_scheduled",
+            "supportedDoneCodes": "dndEnd,returnHomeEnd",
+        }
 
         # Authentication data
         self.uid = None
@@ -172,6 +289,17 @@ class iRobotCloudApi:
         self.credentials = None
         self.deployment = None
         self.robots = {}
+        self.retry_count = 0
+        # Bumped on every authentication so concurrent 403s re-auth only once
+        self._auth_lock = asyncio.Lock()
+        self._auth_epoch = 0
+        self._signer: AWSSignatureV4 | None = None
+        self._signer_credentials = None
+        self._aws_region: str | None = None
+        self._auth_base: str | None = None
+        self._auth_host: str | None = None
+        self._auth_path_prefix = ""
+        self._aws_template = AWSSignatureV4.prepare_template(AWS_REQUEST_HEADERS)
 
         # Headers for requests
         self.headers = {
@@ -198,8 +326,12 @@ class iRobotCloudApi:
             if response.status != 200:
                 raise CloudApiError(f"Discovery failed: {response.status}")
 
-            endpoints = await response.json()
+            endpoints = json_loads(await response.read())
             self.deployment = endpoints["deployments"][endpoints["current_deployment"]]
+            auth_url = urllib.parse.urlsplit(self.deployment["httpBaseAuth"])
+            self._auth_base = self.deployment["httpBaseAuth"].rstrip("/")
+            self._auth_host = auth_url.netloc
+            self._auth_path_prefix = auth_url.path.rstrip("/")
 
             _LOGGER.debug("Discovered deployment: %s", endpoints["current_deployment"])
             return endpoints
@@ -228,15 +360,19 @@ class iRobotCloudApi:
             headers=self.headers,
             data=urllib.parse.urlencode(login_data),
         ) as response:
-            response_text = await response.text()
+            raw = await response.read()
             _LOGGER.debug("Gigya login response status: %d", response.status)
-            _LOGGER.debug("Gigya login response: %s", response_text)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Gigya login response: %s", raw.decode(errors="replace")
+                )
 
             try:
-                login_result = json.loads(response_text)
+                login_result = json_loads(raw)
             except JSONDecodeError as e:
                 raise AuthenticationError(
-                    f"Invalid JSON response from Gigya login: {response_text}"
+                    f"Invalid JSON response from Gigya login: "
+                    f"{raw.decode(errors='replace')}"
                 ) from e
 
             if login_result.get("errorCode", 0) != 0:
@@ -273,7 +409,7 @@ class iRobotCloudApi:
             await self.discover_endpoints()
 
         login_data = {
-            "app_id": f"IOS-{self.config['appId']}",
+            "app_id": self._app_id,
             "app_info": {
                 "device_id": f"IOS-{self.config['deviceId']}",
                 "device_name": "iPhone",
@@ -326,15 +462,19 @@ class iRobotCloudApi:
             headers={"Content-Type": "application/json"},
             json=login_data,
         ) as response:
-            response_text = await response.text()
+            raw = await response.read()
             _LOGGER.debug("iRobot login response status: %d", response.status)
-            _LOGGER.debug("iRobot login response: %s", response_text)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "iRobot login response: %s", raw.decode(errors="replace")
+                )
 
             try:
-                login_result = json.loads(response_text)
+                login_result = json_loads(raw)
             except JSONDecodeError as e:
                 raise AuthenticationError(
-                    f"Invalid JSON response from iRobot login: {response_text}"
+                    f"Invalid JSON response from iRobot login: "
+                    f"{raw.decode(errors='replace')}"
                 ) from e
 
             if login_result.get("errorCode"):
@@ -367,87 +507,86 @@ class iRobotCloudApi:
         await self.login_gigya(endpoints["gigya"]["api_key"])
 
         # Login to iRobot
-        return await self.login_irobot()
+        result = await self.login_irobot()
+        self._auth_epoch += 1
+        return result
+
+    async def _reauthenticate(self, epoch: int) -> None:
+        """Re-authenticate unless another request already did since epoch."""
+        async with self._auth_lock:
+            if epoch == self._auth_epoch:
+                _LOGGER.info("Reauthenticating API")
+                await self.authenticate()
 
     async def _aws_request(
-        self, url: str, params: dict[str, Any] | None = None
+        self, path: str, params: dict[str, Any] | None = None, retry: bool = True
     ) -> dict[str, Any]:
-        """Make an authenticated AWS request."""
+        """Make an authenticated AWS request to a path under httpBaseAuth."""
         if not self.credentials:
             raise AuthenticationError("Not authenticated. Call authenticate() first.")
 
-        region = self.credentials["CognitoId"].split(":")[0]
+        epoch = self._auth_epoch
 
-        # Parse URL
-        parsed_url = urllib.parse.urlparse(url)
+        url = f"{self._auth_base}{path}"
 
-        # Create AWS signer
-        signer = AWSSignatureV4(
-            access_key_id=self.credentials["AccessKeyId"],
-            secret_access_key=self.credentials["SecretKey"],
-            session_token=self.credentials["SessionToken"],
-        )
+        # Reuse the AWS signer (and its derived keys) until credentials change
+        if self._signer is None or self._signer_credentials is not self.credentials:
+            self._signer = AWSSignatureV4(
+                access_key_id=self.credentials["AccessKeyId"],
+                secret_access_key=self.credentials["SecretKey"],
+                session_token=self.credentials["SessionToken"],
+            )
+            self._signer_credentials = self.credentials
+            self._aws_region = self.credentials["CognitoId"].split(":")[0]
+        signer = self._signer
 
         # Generate signed headers
         query_params = params or {}
         signed_headers = signer.generate_signed_headers(
             method="GET",
             service="execute-api",
-            region=region,
-            host=parsed_url.netloc,
-            path=parsed_url.path,
+            region=self._aws_region,
+            host=self._auth_host,
+            path=f"{self._auth_path_prefix}{path}",
             query_params=query_params,
-            headers={
-                "accept": "application/json",
-                "content-type": "application/json",
-                "user-agent": "aws-sdk-iOS/2.27.6 iOS/18.0.1 en_US",
-            },
             payload="",
+            template=self._aws_template,
         )
 
         # Build final URL with query parameters
         if query_params:
-            query_string = urllib.parse.urlencode(query_params)
+            query_string = _encode_query(tuple(query_params.items()))
             final_url = f"{url}?{query_string}"
         else:
             final_url = url
 
         async with self.session.get(final_url, headers=signed_headers) as response:
-            if response.status != 200:
-                if response.status == 403:
-                    await self.authenticate()
-                    _LOGGER.info("Reauthenticating API")
-                    return await self._aws_request(url, params)
-                raise CloudApiError(f"AWS request failed: {response.status}")
+            if response.status == 200:
+                return json_loads(await response.read())
+            status = response.status
 
-            return await response.json()
+        if status == 403 and retry:
+            await self._reauthenticate(epoch)
+            return await self._aws_request(path, params, retry=False)
+        raise CloudApiError(f"AWS request failed: {status}")
 
     async def get_mission_history(self, blid: str) -> dict[str, Any]:
         """Get mission history for a robot."""
-        url = f"{self.deployment['httpBaseAuth']}/v1/{blid}/missionhistory"
-        params = {
-            "app_id": f"IOS-{self.config['appId']}",
-            "filterType": "omit_quickly_canceled_not_scheduled",
-            "supportedDoneCodes": "dndEnd,returnHomeEnd",
-        }
-
-        return await self._aws_request(url, params)
+        return await self._aws_request(
+            f"/v1/{blid}/missionhistory", self._mission_history_params
+        )
 
     async def get_pmaps(self, blid: str) -> list[dict[str, Any]]:
         """Get persistent maps (pmaps) for a robot."""
-        url = f"{self.deployment['httpBaseAuth']}/v1/{blid}/pmaps"
-        params = {"visible": "true", "activeDetails": "2"}
-
-        return await self._aws_request(url, params)
+        return await self._aws_request(f"/v1/{blid}/pmaps", PMAPS_PARAMS)
 
     async def get_pmap_umf(
         self, blid: str, pmap_id: str, version_id: str
     ) -> dict[str, Any]:
         """Get UMF (Unified Map Format) data for a specific pmap."""
-        url = f"{self.deployment['httpBaseAuth']}/v1/{blid}/pmaps/{pmap_id}/versions/{version_id}/umf"
-        params = {"activeDetails": "2"}
-
-        umf_data = await self._aws_request(url, params)
+        umf_data = await self._aws_request(
+            f"/v1/{blid}/pmaps/{pmap_id}/versions/{version_id}/umf", PMAP_UMF_PARAMS
+        )
 
         # Save UMF data for debugging/camera development
         # TODO: Enable during development.
@@ -457,55 +596,81 @@ class iRobotCloudApi:
 
     async def get_favorites(self) -> dict[str, Any]:
         """Get favorite cleaning routines."""
-        url = f"{self.deployment['httpBaseAuth']}/v1/user/favorites"
-        return await self._aws_request(url)
+        return await self._aws_request("/v1/user/favorites")
 
     async def get_robot_data(self, blid: str) -> dict[str, Any]:
         """Get comprehensive robot data including pmaps and mission history."""
         if blid not in self.robots:
             raise CloudApiError(f"Robot {blid} not found in authenticated robots")
 
+        mission_history, pmaps = await asyncio.gather(
+            self.get_mission_history(blid), self.get_pmaps(blid)
+        )
         robot_data = {
             "robot_info": self.robots[blid],
-            "mission_history": await self.get_mission_history(blid),
-            "pmaps": await self.get_pmaps(blid),
+            "mission_history": mission_history,
+            "pmaps": pmaps,
         }
 
         # Get UMF data for active pmaps
-        for pmap in robot_data["pmaps"]:
-            if pmap.get("active_pmapv_id"):
-                try:
-                    robot_data[f"pmap_umf_{pmap['pmap_id']}"] = await self.get_pmap_umf(
-                        blid, pmap["pmap_id"], pmap["active_pmapv_id"]
-                    )
-                except CloudApiError as e:
-                    _LOGGER.warning(
-                        "Failed to get UMF for pmap %s: %s", pmap["pmap_id"], e
-                    )
+        active_pmaps = [pmap for pmap in pmaps if pmap.get("active_pmapv_id")]
+        results = await asyncio.gather(
+            *(
+                self.get_pmap_umf(blid, pmap["pmap_id"], pmap["active_pmapv_id"])
+                for pmap in active_pmaps
+            ),
+            return_exceptions=True,
+        )
+        for pmap, result in zip(active_pmaps, results, strict=True):
+            if isinstance(result, CloudApiError):
+                _LOGGER.warning(
+                    "Failed to get UMF for pmap %s: %s", pmap["pmap_id"], result
+                )
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                robot_data[f"pmap_umf_{pmap['pmap_id']}"] = result
 
         return robot_data
 
-    retry_count = 0
+    async def get_all_robots_data(
+        self, include_favorites: bool = True
+    ) -> dict[str, dict[str, Any]]:
+        """Get data for all authenticated robots.
 
-    async def get_all_robots_data(self) -> dict[str, dict[str, Any]]:
-        """Get data for all authenticated robots."""
+        Favorites are left out of the result when include_favorites is False.
+        """
         if not self.robots:
             if self.retry_count == 3:
                 raise CloudApiError("No robots found. Authenticate first.")
             self.retry_count += 1
             await self.authenticate()
-            return await self.get_all_robots_data()
+            return await self.get_all_robots_data(include_favorites)
+        self.retry_count = 0
+
+        blids = list(self.robots)
+        requests = [self.get_robot_data(blid) for blid in blids]
+        if include_favorites:
+            requests.append(self.get_favorites())
+        results = await asyncio.gather(*requests, return_exceptions=True)
+        robot_results = results[: len(blids)]
 
         all_data = {}
-        for blid in self.robots:
-            try:
-                all_data[blid] = await self.get_robot_data(blid)
+        for blid, result in zip(blids, robot_results, strict=True):
+            if isinstance(result, CloudApiError):
+                _LOGGER.error("Failed to get data for robot %s: %s", blid, result)
+                all_data[blid] = {"error": str(result)}
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                all_data[blid] = result
                 _LOGGER.debug("Retrieved data for robot %s", blid)
-            except CloudApiError as e:
-                _LOGGER.error("Failed to get data for robot %s: %s", blid, e)
-                all_data[blid] = {"error": str(e)}
 
-        all_data["favorites"] = await self.get_favorites()
+        if include_favorites:
+            favorites = results[-1]
+            if isinstance(favorites, BaseException):
+                raise favorites
+            all_data["favorites"] = favorites
         return all_data
 
     async def _save_umf_data_for_debug(
@@ -515,6 +680,10 @@ class iRobotCloudApi:
         if not DEBUG_SAVE_UMF:
             return
 
+        # Only needed for this development aid, keep it off the import path
+        import aiofiles  # noqa: PLC0415
+        import aiofiles.os  # noqa: PLC0415
+
         try:
             # Create debug data structure
             debug_data = {
@@ -525,7 +694,7 @@ class iRobotCloudApi:
 
             # Load existing data if file exists
             existing_data = []
-            if DEBUG_UMF_PATH.exists():
+            if await aiofiles.os.path.exists(DEBUG_UMF_PATH):
                 try:
                     async with aiofiles.open(DEBUG_UMF_PATH) as f:
                         content = await f.read()
@@ -544,7 +713,9 @@ class iRobotCloudApi:
 
             # Save back to file
             async with aiofiles.open(DEBUG_UMF_PATH, "w") as f:
-                await f.write(json.dumps(existing_data, indent=2, default=str))
+                await f.write(
+                    json.dumps(existing_data, separators=(",", ":"), default=str)
+                )
 
             _LOGGER.debug("Saved UMF data for pmap %s to %s", pmap_id, DEBUG_UMF_PATH)
 
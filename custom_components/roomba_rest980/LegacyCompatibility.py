@@ -16,10 +16,20 @@ from .const import (
 )
 
 
+def _elapsed_minutes(timestamp: float, now_ts: float) -> int:
+    """Return the whole minutes between a Unix timestamp and now."""
+    return round((now_ts - timestamp) / 60)
+
+
 def createExtendedAttributes(self) -> dict[str, any]:
     """Return all the given attributes from rest980."""
-    data = self.coordinator.data or {}
+    return _buildExtendedAttributes(self.coordinator.data or {})
+
+
+def _buildExtendedAttributes(data: dict[str, any]) -> dict[str, any]:
+    """Build the extended attributes from a rest980 state payload."""
     status = data.get("cleanMissionStatus", {})
+    now_ts = datetime.now().timestamp()
     # Mission State
     cycle = status.get("cycle")
     phase = status.get("phase")
@@ -58,8 +68,7 @@ def createExtendedAttributes(self) -> dict[str, any]:
     else:
         rPhase = phaseMappings.get(phase, phase)
     if missionStartTime != 0:
-        time = datetime.fromtimestamp(missionStartTime)
-        elapsed = round((datetime.now().timestamp() - time.timestamp()) / 60)
+        elapsed = _elapsed_minutes(missionStartTime, now_ts)
         if elapsed > 60:
             jobTime = f"{elapsed // 60}h {f'{elapsed % 60:0>2d}'}m"
         else:
@@ -67,18 +76,16 @@ def createExtendedAttributes(self) -> dict[str, any]:
     else:
         jobTime = "n-a"
     if rechargeTime != 0:
-        time = datetime.fromtimestamp(rechargeTime)
-        resume = round((datetime.now().timestamp() - time.timestamp()) / 60)
-        if elapsed > 60:
+        resume = _elapsed_minutes(rechargeTime, now_ts)
+        if resume > 60:
             jobResumeTime = f"{resume // 60}h {f'{resume % 60:0>2d}'}m"
         else:
             jobResumeTime = f"{resume}m"
     else:
         jobResumeTime = "n-a"
     if expireTime != 0:
-        time = datetime.fromtimestamp(expireTime)
-        expire = round((datetime.now().timestamp() - time.timestamp()) / 60)
-        if elapsed > 60:
+        expire = _elapsed_minutes(expireTime, now_ts)
+        if expire > 60:
             jobExpireTime = f"{expire // 60}h {f'{expire % 60:0>2d}'}m"
         else:
             jobExpireTime = f"{expire}m"
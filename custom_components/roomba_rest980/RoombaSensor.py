@@ -1,5 +1,6 @@
 """A generic sensor to provide the coordinator and device info."""
 
+from functools import lru_cache
 import logging
 
 from homeassistant.components.sensor import SensorEntity
@@ -12,10 +13,37 @@ from .const import DOMAIN
 _LOGGER = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def device_identifiers(unique_id: str) -> frozenset[tuple[str, str]]:
+    """Return the device registry identifiers for a config entry's robot."""
+    return frozenset({(DOMAIN, unique_id)})
+
+
+def shared_device_info(entry) -> DeviceInfo:
+    """Return the device info shared by all sensors of a config entry.
+
+    Built once from the local coordinator's data; Home Assistant only reads
+    an entity's device info when the entity is registered.
+    """
+    runtime_data = entry.runtime_data
+    if runtime_data.device_info is None:
+        data = runtime_data.local_coordinator.data or {}
+        runtime_data.device_info = DeviceInfo(
+            identifiers=device_identifiers(entry.unique_id),
+            name=data.get("name", "Roomba"),
+            manufacturer="iRobot",
+            model="Roomba",
+            model_id=data.get("sku"),
+            sw_version=data.get("softwareVer"),
+        )
+    return runtime_data.device_info
+
+
 class RoombaSensor(CoordinatorEntity, SensorEntity):
     """Generic Roomba sensor to provide coordinator."""
 
     _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
     _rs_given_info: tuple[str, str] = ("Sensor", "sensor")
 
     def __init__(self, coordinator, entry) -> None:
@@ -23,41 +51,18 @@ class RoombaSensor(CoordinatorEntity, SensorEntity):
         super().__init__(coordinator)
         _LOGGER.debug("Entry unique_id: %s", entry.unique_id)
         self._entry = entry
-        self._attr_entity_category = EntityCategory.DIAGNOSTIC
-        self._attr_has_entity_name = True
         self._attr_name = self._rs_given_info[0]
         self._attr_unique_id = f"{entry.unique_id}_{self._rs_given_info[1]}"
+        self._attr_device_info = shared_device_info(entry)
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return the Roomba's device information."""
-        data = self.coordinator.data or {}
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.unique_id)},
-            name=data.get("name", "Roomba"),
-            manufacturer="iRobot",
-            model="Roomba",
-            model_id=data.get("sku"),
-            sw_version=data.get("softwareVer"),
-        )
+    async def async_added_to_hass(self) -> None:
+        """Fill in the state from data the coordinator already has."""
+        await super().async_added_to_hass()
+        self._handle_coordinator_update()
 
     def isMissionActive(self) -> bool:
         """Return whether or not there is a mission in progress."""
-        data = self.coordinator.data or {}
-        status = data.get("cleanMissionStatus", {})
-        # Mission State
-        phase = status.get("phase")
-        battery = data.get("batPct")
-        state = False
-        if status.get("mssnStrtTm"):
-            state = True
-        if phase == "charge" and battery == 100:
-            state = False
-        return state
-
-    def returnIn(self, mapping: dict[str, str], index: str) -> str:
-        """Default or map value."""
-        mapping.get(index, index)
+        return self.coordinator.mission_active
 
     def _get_default(self, key: str, default: str):
         return self.coordinator.data.get(key) if self.coordinator.data else default
@@ -67,6 +72,7 @@ class RoombaCloudSensor(CoordinatorEntity, SensorEntity):
     """Generic Roomba sensor to provide coordinator."""
 
     _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
     _rs_given_info: tuple[str, str] = ("Sensor", "sensor")
 
     def __init__(self, coordinator, entry) -> None:
@@ -74,22 +80,13 @@ class RoombaCloudSensor(CoordinatorEntity, SensorEntity):
         super().__init__(coordinator)
         _LOGGER.debug("Entry unique_id: %s", entry.unique_id)
         self._entry = entry
-        self._attr_entity_category = EntityCategory.DIAGNOSTIC
-        self._attr_has_entity_name = True
         self._attr_name = self._rs_given_info[0]
         self._attr_unique_id = f"{entry.unique_id}_{self._rs_given_info[1]}"
+        self._attr_device_info = shared_device_info(entry)
         if not entry.data["cloud_api"]:
             self._attr_available = False
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return the Roomba's device information."""
-        data = self.coordinator.data or {}
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.unique_id)},
-            name=data.get("name", "Roomba"),
-            manufacturer="iRobot",
-            model="Roomba",
-            model_id=data.get("sku"),
-            sw_version=data.get("softwareVer"),
-        )
+    async def async_added_to_hass(self) -> None:
+        """Fill in the state from data the coordinator already has."""
+        await super().async_added_to_hass()
+        self._handle_coordinator_update()
@@ -1,59 +1,75 @@
 """Buttons needed."""
 
-import logging
-
 from homeassistant.components.button import ButtonEntity
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import EntityCategory
 
-from .const import DOMAIN
-
-_LOGGER = logging.getLogger(__name__)
+from .RoombaSensor import device_identifiers
+from .services import async_send_clean
 
 
 async def async_setup_entry(hass: HomeAssistant, entry, async_add_entities):
     """Create the switches to identify cleanable rooms."""
     cloudCoordinator = entry.runtime_data.cloud_coordinator
-    entities = []
-    if cloudCoordinator and cloudCoordinator.data:
-        blid = entry.runtime_data.robot_blid
-        # Get cloud data for the specific robot
-        if blid in cloudCoordinator.data:
-            cloud_data = cloudCoordinator.data
-            # Create button entities from cloud data
-            if "favorites" in cloud_data:
-                entities.extend(
-                    [FavoriteButton(entry, fav) for fav in cloud_data["favorites"]]
-                )
-    async_add_entities(entities)
+    if not cloudCoordinator:
+        return
+
+    @callback
+    def _async_add_favorites() -> None:
+        entities = []
+        if cloudCoordinator.data:
+            blid = entry.runtime_data.robot_blid
+            # Get cloud data for the specific robot
+            if blid in cloudCoordinator.data:
+                cloud_data = cloudCoordinator.data
+                # Create button entities from cloud data
+                if "favorites" in cloud_data:
+                    device_info = {
+                        "identifiers": device_identifiers(entry.unique_id),
+                        "name": entry.title,
+                        "manufacturer": "iRobot",
+                    }
+                    entities.extend(
+                        FavoriteButton(entry, fav, device_info)
+                        for fav in cloud_data["favorites"]
+                    )
+        async_add_entities(entities)
+
+    # Favorites are only known once the background cloud setup has finished
+    cloudCoordinator.async_run_when_ready(_async_add_favorites)
 
 
 class FavoriteButton(ButtonEntity):
     """A button entity to initiate iRobot favorite routines."""
 
-    def __init__(self, entry, data) -> None:
+    _attr_entity_category = EntityCategory.CONFIG
+    _attr_icon = "mdi:star"
+
+    def __init__(self, entry, data, device_info) -> None:
         """Creates a button entity for entries."""
         self._attr_name = f"{data['name']}"
         self._entry = entry
+        self._cloud_coordinator = entry.runtime_data.cloud_coordinator
         self._attr_unique_id = f"{entry.entry_id}_{data['favorite_id']}"
-        self._attr_entity_category = EntityCategory.CONFIG
         self._attr_extra_state_attributes = data
-        self._data = data
-        self._attr_icon = "mdi:star"
         self._attr_entity_registry_enabled_default = not data["hidden"]
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.unique_id)},
-            "name": entry.title,
-            "manufacturer": "iRobot",
-        }
+        # Shared by every favorite button of the entry
+        self._attr_device_info = device_info
+        self._clean_payload = {"cmd": f"favorite_id: {data['favorite_id']}"}
+
+    async def async_added_to_hass(self) -> None:
+        """Keep the cloud coordinator fetching favorites while enabled."""
+        await super().async_added_to_hass()
+        self._cloud_coordinator.favorite_consumers += 1
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Release this button's claim on the favorites."""
+        await super().async_will_remove_from_hass()
+        self._cloud_coordinator.favorite_consumers -= 1
 
     async def async_press(self):
         """Send command out to clean with the ID."""
-        await self.hass.services.async_call(
-            DOMAIN,
-            "rest980_clean",
-            service_data={
-                "base_url": self._entry.data["base_url"],
-                "payload": {"cmd": f"favorite_id: {self._data['favorite_id']}"},
-            },
+        # Post straight to rest980 rather than through the rest980_clean service
+        await async_send_clean(
+            self.hass, self._entry.data["base_url"], self._clean_payload
         )
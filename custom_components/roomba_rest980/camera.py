@@ -1,7 +1,9 @@
 """Camera platform for Roomba map visualization."""
 
+from functools import cached_property, lru_cache
 import io
 import logging
+import math
 from pathlib import Path
 from typing import Any
 
@@ -9,11 +11,12 @@ from PIL import Image, ImageDraw, ImageFont
 
 from homeassistant.components.camera import Camera
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN, regionTypeMappings
+from .const import regionTypeMappings
+from .RoombaSensor import device_identifiers
 
 FONT_PATH = Path(__file__).parent / "fonts" / "OpenSans-Regular.ttf"
 
@@ -32,10 +35,62 @@ FONT_SIZES = {
     14: load_font(14),
     24: load_font(24),
 }
+# Label box height per size, from the top of the line to the descender
+FONT_HEIGHTS = {size: font.getbbox("Ag")[3] for size, font in FONT_SIZES.items()}
+
+
+@lru_cache(maxsize=256)
+def render_label(text: str, size: int, color: tuple[int, int, int]) -> Image.Image:
+    """Render text on a white box with 2px of padding.
+
+    Room and zone names rarely change, so labels are rendered once and pasted.
+    """
+    font = FONT_SIZES[size]
+    width = math.ceil(font.getlength(text)) + 5
+    height = FONT_HEIGHTS[size] + 5
+    label = Image.new("RGB", (width, height), (255, 255, 255))
+    ImageDraw.Draw(label).text((2, 2), text, fill=color, font=font)
+    return label
+
+
+def encode_png(img: Image.Image) -> bytes:
+    """Encode a rendered map image as PNG."""
+    img_bytes = io.BytesIO()
+    # zlib level 3 encodes ~30% faster than the default 6 for a slightly
+    # larger file; the map is flat-colored, so it still compresses well
+    img.save(img_bytes, format="PNG", compress_level=3)
+    return img_bytes.getvalue()
+
+
+@lru_cache(maxsize=1)
+def render_no_data_png() -> bytes:
+    """Render the "No Map Data Available" placeholder.
+
+    The placeholder is the same for every camera, so it is encoded once.
+    """
+    img = Image.new("RGB", (MAP_WIDTH, MAP_HEIGHT), BACKGROUND_COLOR)
+    draw = ImageDraw.Draw(img)
+    text = "No Map Data Available"
+    text_width = draw.textlength(text, font=FONT_SIZES[24])
+    text_height = FONT_HEIGHTS[24]
+    x = (MAP_WIDTH - text_width) // 2
+    y = (MAP_HEIGHT - text_height) // 2
+    draw.text((x, y), text, fill=TEXT_COLOR, font=FONT_SIZES[24])
+    return encode_png(img)
 
 
 _LOGGER = logging.getLogger(__name__)
 
+# (image coordinates, x sum, y sum) of a resolved polygon; the sums give
+# centroids without another pass over the vertices
+MapPolygon = tuple[list[tuple[int, int]], int, int]
+# (image coordinates, fill color, border color) of a semi-transparent zone
+TransparentPolygon = tuple[
+    list[tuple[int, int]], tuple[int, int, int], tuple[int, int, int]
+]
+# (x, y, text, color) of a zone label, drawn after the zone fills
+ZoneLabel = tuple[int, int, str, tuple[int, int, int]]
+
 # Map rendering constants
 MAP_WIDTH = 800
 MAP_HEIGHT = 600
@@ -72,62 +127,132 @@ async def async_setup_entry(
     cloudCoordinator = entry.runtime_data.cloud_coordinator
 
     if not cloudCoordinator:
-        _LOGGER.warning("No cloud coordinator found for camera setup")
+        _LOGGER.debug("Cloud API disabled, no map cameras to set up")
         return
 
-    if not cloudCoordinator.data:
-        _LOGGER.warning("Cloud coordinator has no data yet for camera setup")
-        return
+    @callback
+    def _async_add_cameras() -> None:
+        if not cloudCoordinator.data:
+            _LOGGER.warning("Cloud coordinator has no data yet for camera setup")
+            return
 
-    entities = []
-    blid = entry.runtime_data.robot_blid
-    _LOGGER.debug("Using BLID: %s for camera setup", blid)
-
-    if blid != "unknown" and blid in cloudCoordinator.data:
-        cloud_data = cloudCoordinator.data[blid]
-        _LOGGER.debug("Found cloud data for BLID %s", blid)
-
-        if "pmaps" in cloud_data:
-            _LOGGER.debug("Found %d pmaps in cloud data", len(cloud_data["pmaps"]))
-            for pmap in cloud_data["pmaps"]:
-                pmap_id = pmap.get("pmap_id", "unknown")
-                umf_key = f"pmap_umf_{pmap_id}"
-                _LOGGER.debug("Checking for UMF data key: %s", umf_key)
-
-                if umf_key in cloud_data:
-                    _LOGGER.info("Creating camera entity for pmap %s", pmap_id)
-                    entities.append(
-                        RoombaMapCamera(
-                            cloudCoordinator, entry, pmap_id, cloud_data[umf_key]
+        entities = []
+        blid = entry.runtime_data.robot_blid
+        _LOGGER.debug("Using BLID: %s for camera setup", blid)
+
+        if blid != "unknown" and blid in cloudCoordinator.data:
+            cloud_data = cloudCoordinator.data[blid]
+            _LOGGER.debug("Found cloud data for BLID %s", blid)
+
+            if "pmaps" in cloud_data:
+                _LOGGER.debug("Found %d pmaps in cloud data", len(cloud_data["pmaps"]))
+                # Shared by every map camera of the entry
+                rdata = cloud_data["robot_info"]
+                device_info = DeviceInfo(
+                    identifiers=device_identifiers(entry.unique_id),
+                    name=rdata["name"],
+                    manufacturer="iRobot",
+                    model="Roomba",
+                    model_id=rdata["sku"],
+                    sw_version=rdata["softwareVer"],
+                )
+                for pmap in cloud_data["pmaps"]:
+                    pmap_id = pmap.get("pmap_id", "unknown")
+                    umf_key = f"pmap_umf_{pmap_id}"
+                    _LOGGER.debug("Checking for UMF data key: %s", umf_key)
+
+                    if umf_key in cloud_data:
+                        _LOGGER.info("Creating camera entity for pmap %s", pmap_id)
+                        entities.append(
+                            RoombaMapCamera(
+                                cloudCoordinator,
+                                entry,
+                                pmap_id,
+                                cloud_data[umf_key],
+                                device_info,
+                            )
+                        )
+                    else:
+                        _LOGGER.warning(
+                            "No UMF data found for pmap %s (key: %s)", pmap_id, umf_key
                         )
-                    )
-                else:
-                    _LOGGER.warning(
-                        "No UMF data found for pmap %s (key: %s)", pmap_id, umf_key
-                    )
+            else:
+                _LOGGER.warning("No pmaps found in cloud data")
         else:
-            _LOGGER.warning("No pmaps found in cloud data")
-    else:
-        _LOGGER.warning("BLID %s not found in cloud data", blid)
+            _LOGGER.warning("BLID %s not found in cloud data", blid)
 
-    if entities:
-        _LOGGER.info("Adding %d camera entities", len(entities))
-        async_add_entities(entities)
-    else:
-        _LOGGER.warning("No camera entities created")
+        if entities:
+            _LOGGER.info("Adding %d camera entities", len(entities))
+            async_add_entities(entities)
+        else:
+            _LOGGER.warning("No camera entities created")
+
+    # Maps are only known once the background cloud setup has finished
+    cloudCoordinator.async_run_when_ready(_async_add_cameras)
 
 
 class RoombaMapCamera(Camera):
     """Camera entity that renders Roomba map data as an image."""
 
     def __init__(
-        self, coordinator, entry, pmap_id: str, umf_data: dict[str, Any]
+        self,
+        coordinator,
+        entry,
+        pmap_id: str,
+        umf_data: dict[str, Any],
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the map camera."""
         super().__init__()
         self._coordinator = coordinator
         self._entry = entry
+        self._blid = entry.runtime_data.robot_blid
         self._pmap_id = pmap_id
+        # Map version the UMF data belongs to; new UMF data comes with a new one
+        self._pmapv_id = self._active_pmapv_id()
+        self._set_umf_data(umf_data)
+
+        # Camera attributes
+        name = self._map_header.get("name", "Unknown")
+        if len(name) == 0:
+            name = "New Map"
+
+        self._attr_name = name
+        self._attr_unique_id = f"{entry.entry_id}_map_{pmap_id}"
+        self._attr_device_info = device_info
+
+    async def async_added_to_hass(self) -> None:
+        """Follow map updates from the cloud coordinator."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._coordinator.async_add_listener(self._handle_coordinator_update)
+        )
+
+    def _active_pmapv_id(self) -> str | None:
+        """Return the active version of this camera's map in the cloud data."""
+        robot_data = (self._coordinator.data or {}).get(self._blid) or {}
+        for pmap in robot_data.get("pmaps") or []:
+            if pmap.get("pmap_id") == self._pmap_id:
+                return pmap.get("active_pmapv_id")
+        return None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Pick up the UMF data of a new map version."""
+        pmapv_id = self._active_pmapv_id()
+        if pmapv_id == self._pmapv_id:
+            return
+        robot_data = self._coordinator.data.get(self._blid) or {}
+        umf_data = robot_data.get(f"pmap_umf_{self._pmap_id}")
+        if umf_data is None:
+            return
+        self._pmapv_id = pmapv_id
+        # Drops the cached PNG, rooms and calibration
+        self._set_umf_data(umf_data)
+        self.async_write_ha_state()
+
+    def _set_umf_data(self, umf_data: dict[str, Any]) -> None:
+        """Store new UMF data and rebuild everything derived from it."""
         self._umf_data = umf_data
 
         # Extract map info
@@ -150,458 +275,354 @@ class RoombaMapCamera(Camera):
             self._clean_zones = []
             self._observed_zones = []
 
-        # Camera attributes
-        name = self._map_header.get("name", "Unknown")
-        if len(name) == 0:
-            name = "New Map"
+        self._transform = self._compute_transform()
+        # Rendered PNG, reused until the map data changes
+        self._png_cache: bytes | None = None
+        # Drop the cached rooms and calibration attributes
+        self.__dict__.pop("rooms", None)
+        self.__dict__.pop("calibration", None)
+
+        # Coordinate ID -> image position, transformed once per map update.
+        # The first point with an ID wins.
+        self._image_points = {}
+        if self._transform:
+            *_, scale, offset_x, offset_y = self._transform
+            for point in self._points2d:
+                coord_id = point.get("id")
+                coord = point.get("coordinates")
+                if coord_id in self._image_points or not coord or len(coord) < 2:
+                    continue
+                # Whole pixels, which is what PIL rasterizes anyway
+                self._image_points[coord_id] = (
+                    int(coord[0] * scale + offset_x),
+                    int(MAP_HEIGHT - (coord[1] * scale + offset_y)),  # Flip Y axis
+                )
 
-        self._attr_name = name
-        self._attr_unique_id = f"{entry.entry_id}_map_{pmap_id}"
+        # Resolve region and zone polygons to image coordinates once, so
+        # rendering and the rooms attribute only walk prepared lists
+        self._room_shapes: list[dict[str, Any]] = []
+        for i, region in enumerate(self._regions):
+            polygons = self._resolve_polygons(region)
+            if not polygons:
+                continue
+            self._room_shapes.append(
+                {
+                    "id": region.get("region_id", str(i)),
+                    "name": region.get("name", f"Room {i + 1}"),
+                    "region_type": region.get("region_type", "default"),
+                    "color": ROOM_COLORS[i % len(ROOM_COLORS)],
+                    "polygons": polygons,
+                }
+            )
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return the Roomba's device information."""
-        data = self._coordinator.data or {}
-        rdata = data[self._entry.runtime_data.robot_blid]["robot_info"]
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.unique_id)},
-            name=rdata["name"],
-            manufacturer="iRobot",
-            model="Roomba",
-            model_id=rdata["sku"],
-            sw_version=rdata["softwareVer"],
+        self._zone_shapes: list[dict[str, Any]] = []
+        zone_styles = (
+            # Keepout zones (red) are always labelled "KEEP OUT"
+            (self._keepout_zones, KEEPOUT_ZONE_COLOR, KEEPOUT_ZONE_BORDER, None),
+            # Clean zones (green)
+            (self._clean_zones, CLEAN_ZONE_COLOR, CLEAN_ZONE_BORDER, "Clean Zone"),
+            # Observed zones (orange)
+            (
+                self._observed_zones,
+                OBSERVED_ZONE_COLOR,
+                OBSERVED_ZONE_BORDER,
+                "Observed",
+            ),
         )
+        for zones, fill_color, border_color, default_name in zone_styles:
+            for zone in zones:
+                polygons = self._resolve_polygons(zone)
+                if not polygons:
+                    continue
+                label = (
+                    "KEEP OUT"
+                    if default_name is None
+                    else zone.get("name", default_name)
+                )
+                # Keepout and observed zones are drawn semi-transparent,
+                # other zones get a dashed border
+                transparent = label in {"KEEP OUT", "Observed"}
+                dashes = []
+                if not transparent:
+                    for polygon_coords, _, _ in polygons:
+                        dashes.extend(self._dash_segments(polygon_coords))
+                self._zone_shapes.append(
+                    {
+                        "label": label,
+                        "fill": fill_color[:3],
+                        "border": border_color,
+                        "transparent": transparent,
+                        "polygons": polygons,
+                        "dashes": dashes,
+                    }
+                )
+
+    def _resolve_polygons(
+        self, shape: dict[str, Any]
+    ) -> list[MapPolygon]:
+        """Return a region or zone's polygons as image coordinates.
+
+        Coordinate IDs without a known point are skipped, and polygons left
+        with fewer than 3 points are dropped.
+        """
+        geometry = shape.get("geometry")
+        if not geometry or geometry.get("type") != "polygon":
+            return []
+
+        image_points = self._image_points
+        polygons = []
+        for polygon_id_list in geometry.get("ids", []):
+            if not isinstance(polygon_id_list, list):
+                continue
+            polygon_coords = []
+            append = polygon_coords.append
+            x_sum = y_sum = 0
+            for coord_id in polygon_id_list:
+                point = image_points.get(coord_id)
+                if point is None:
+                    continue
+                append(point)
+                x_sum += point[0]
+                y_sum += point[1]
+            if len(polygon_coords) >= 3:  # Need at least 3 points for polygon
+                polygons.append((polygon_coords, x_sum, y_sum))
+        return polygons
+
+    def _compute_transform(
+        self,
+    ) -> tuple[float, float, float, float, float, float, float] | None:
+        """Return (min_x, max_x, min_y, max_y, scale, offset_x, offset_y).
+
+        The scale and offsets fit the map into the image with a 20px margin.
+        Returns None when the points do not span an area.
+        """
+        min_x = min_y = math.inf
+        max_x = max_y = -math.inf
+        for point in self._points2d:
+            coord = point.get("coordinates")
+            if not coord or len(coord) < 2:
+                continue
+            x, y = coord[0], coord[1]
+            if x < min_x:
+                min_x = x
+            if x > max_x:
+                max_x = x
+            if y < min_y:
+                min_y = y
+            if y > max_y:
+                max_y = y
+
+        map_width = max_x - min_x
+        map_height = max_y - min_y
+        # Also false when no point had coordinates (inf - inf is nan)
+        if not (map_width > 0 and map_height > 0):
+            return None
+
+        # Calculate scale to fit image, leaving 20px margin on each side
+        scale_x = (MAP_WIDTH - 40) / map_width
+        scale_y = (MAP_HEIGHT - 40) / map_height
+        scale = min(scale_x, scale_y)
+
+        # Center the map
+        offset_x = (MAP_WIDTH - map_width * scale) / 2 - min_x * scale
+        offset_y = (MAP_HEIGHT - map_height * scale) / 2 - min_y * scale
+        return min_x, max_x, min_y, max_y, scale, offset_x, offset_y
 
     async def async_camera_image(
         self, width: int | None = None, height: int | None = None
     ) -> bytes | None:
         """Return camera image."""
+        if self._png_cache is not None:
+            return self._png_cache
+        umf_data = self._umf_data
+        # _set_umf_data replaces these lists rather than mutating them, so
+        # the render works on a consistent snapshot of one map version
+        shapes = (
+            (self._room_shapes, self._zone_shapes)
+            if self._points2d and self._regions
+            else None
+        )
         try:
-            return self._render_map()
+            # PIL drawing and PNG encoding would block the event loop
+            png = await self.hass.async_add_executor_job(self._render_map, shapes)
         except Exception as e:
             _LOGGER.error("Error rendering map image: %s", e)
             return None
+        # Don't cache a render of a map that was replaced in the meantime
+        if self._umf_data is umf_data:
+            self._png_cache = png
+        return png
 
-    def _render_map(self) -> bytes:
-        """Render the map as a PNG image."""
+    def _render_map(
+        self,
+        shapes: tuple[list[dict[str, Any]], list[dict[str, Any]]] | None,
+    ) -> bytes:
+        """Render room and zone shapes as a PNG image.
+
+        Runs in the executor, so it only reads the shapes it is given.
+        """
+        if shapes is None:
+            # Shared "No Map Data" placeholder
+            return render_no_data_png()
+
+        room_shapes, zone_shapes = shapes
         # Create image
         img = Image.new("RGB", (MAP_WIDTH, MAP_HEIGHT), BACKGROUND_COLOR)
         draw = ImageDraw.Draw(img)
 
-        if not self._points2d or not self._regions:
-            # Draw "No Map Data" message
-
-            text = "No Map Data Available"
-            bbox = draw.textbbox((0, 0), text, font=FONT_SIZES[24])
-            text_width = bbox[2] - bbox[0]
-            text_height = bbox[3] - bbox[1]
-            x = (MAP_WIDTH - text_width) // 2
-            y = (MAP_HEIGHT - text_height) // 2
-            draw.text((x, y), text, fill=TEXT_COLOR, font=FONT_SIZES[24])
-
-        # Calculate map bounds from points2d
-        elif self._points2d:
-            # Extract all coordinates
-            all_coords = [
-                point["coordinates"]
-                for point in self._points2d
-                if "coordinates" in point
-            ]
-
-            if all_coords:
-                # Find min/max coordinates
-                x_coords = [coord[0] for coord in all_coords if len(coord) >= 2]
-                y_coords = [coord[1] for coord in all_coords if len(coord) >= 2]
-
-                if x_coords and y_coords:
-                    min_x, max_x = min(x_coords), max(x_coords)
-                    min_y, max_y = min(y_coords), max(y_coords)
+        # Draw rooms
+        self._draw_regions(img, draw, room_shapes)
 
-                    # Calculate scale to fit image
-                    map_width = max_x - min_x
-                    map_height = max_y - min_y
+        # Draw zones (keepout, clean, observed)
+        self._draw_zones(img, draw, zone_shapes)
 
-                    if map_width > 0 and map_height > 0:
-                        scale_x = (
-                            MAP_WIDTH - 40
-                        ) / map_width  # Leave 20px margin on each side
-                        scale_y = (MAP_HEIGHT - 40) / map_height
-                        scale = min(scale_x, scale_y)
-
-                        # Center the map
-                        offset_x = (MAP_WIDTH - map_width * scale) / 2 - min_x * scale
-                        offset_y = (MAP_HEIGHT - map_height * scale) / 2 - min_y * scale
-
-                        # Draw rooms
-                        self._draw_regions(draw, offset_x, offset_y, scale)
-
-                        # Draw coordinate points (walls/obstacles)
-                        self._draw_points(draw, offset_x, offset_y, scale)
-
-                        # Draw zones (keepout, clean, observed)
-                        img = self._draw_zones(img, offset_x, offset_y, scale)
-
-        # Convert to bytes
-        img_bytes = io.BytesIO()
-        img.save(img_bytes, format="PNG")
-        return img_bytes.getvalue()
+        return encode_png(img)
 
     def _draw_regions(
-        self, draw: ImageDraw.ImageDraw, offset_x: float, offset_y: float, scale: float
+        self,
+        img: Image.Image,
+        draw: ImageDraw.ImageDraw,
+        room_shapes: list[dict[str, Any]],
     ) -> None:
         """Draw room regions on the map."""
-        for i, region in enumerate(self._regions):
-            if "geometry" not in region:
-                continue
-
-            geometry = region["geometry"]
-            if geometry.get("type") != "polygon":
-                continue
-
-            # Get coordinates by ID references
-            polygon_ids = geometry.get("ids", [])
-            room_color = ROOM_COLORS[i % len(ROOM_COLORS)]
-
-            for polygon_id_list in polygon_ids:
-                if not isinstance(polygon_id_list, list):
-                    continue
+        polygon = draw.polygon
+        line = draw.line
+        for room in room_shapes:
+            room_color = room["color"]
+            room_name = room["name"]
+            for polygon_coords, x_sum, y_sum in room["polygons"]:
+                # Fill polygon, then stroke the border as one closed line;
+                # a wide polygon outline rasterizes a full-size mask each time
+                polygon(polygon_coords, fill=room_color)
+                line(
+                    [*polygon_coords, polygon_coords[0]],
+                    fill=ROOM_BORDER_COLOR,
+                    width=2,
+                    joint="curve",
+                )
 
-                # Find coordinates for this polygon
-                polygon_coords = []
-                for coord_id in polygon_id_list:
-                    coord = self._find_coordinate_by_id(coord_id)
-                    if coord:
-                        # Transform coordinate to image space
-                        x = coord[0] * scale + offset_x
-                        y = MAP_HEIGHT - (coord[1] * scale + offset_y)  # Flip Y axis
-                        polygon_coords.append((x, y))
-
-                if len(polygon_coords) >= 3:  # Need at least 3 points for polygon
-                    # Fill polygon
-                    draw.polygon(
-                        polygon_coords,
-                        fill=room_color,
-                        outline=ROOM_BORDER_COLOR,
-                        width=2,
-                    )
-
-                    # Add room label
-                    room_name = region.get("name", f"Room {i + 1}")
-                    self._draw_room_label(draw, polygon_coords, room_name)
-
-    def _draw_points(
-        self, draw: ImageDraw.ImageDraw, offset_x: float, offset_y: float, scale: float
-    ) -> None:
-        """Draw coordinate points (walls, obstacles) on the map."""
-        for point in self._points2d:
-            coordinates = point.get("coordinates", [])
-            if len(coordinates) >= 2:
-                x = coordinates[0] * scale + offset_x
-                y = MAP_HEIGHT - (coordinates[1] * scale + offset_y)  # Flip Y axis
-                # draw.ellipse([x - 1, y - 1, x + 1, y + 1], fill=WALL_COLOR)
-
-    def _find_coordinate_by_id(self, coord_id: str) -> list[float] | None:
-        """Find coordinate data by ID reference."""
-        for point in self._points2d:
-            if point.get("id") == coord_id:
-                return point.get("coordinates")
-        return None
+                # Add room label at the polygon's centroid
+                count = len(polygon_coords)
+                self._draw_room_label(img, x_sum // count, y_sum // count, room_name)
 
     def _draw_room_label(
         self,
-        draw: ImageDraw.ImageDraw,
-        polygon_coords: list[tuple[float, float]],
+        img: Image.Image,
+        x: int,
+        y: int,
         text: str,
     ) -> None:
-        """Draw room name label in the center of the polygon."""
-        if not polygon_coords:
-            return
-
-        # Calculate centroid
-        x_sum = sum(coord[0] for coord in polygon_coords)
-        y_sum = sum(coord[1] for coord in polygon_coords)
-        centroid_x = x_sum / len(polygon_coords)
-        centroid_y = y_sum / len(polygon_coords)
-
-        # Draw text
-        bbox = draw.textbbox((0, 0), text, font=FONT_SIZES[14])
-        text_width = bbox[2] - bbox[0]
-        text_height = bbox[3] - bbox[1]
-
-        x = centroid_x - text_width / 2
-        y = centroid_y - text_height / 2
-
-        # Draw text background
-        draw.rectangle(
-            [x - 2, y - 2, x + text_width + 2, y + text_height + 2],
-            fill=(255, 255, 255, 180),
-        )
-        draw.text((x, y), text, fill=TEXT_COLOR, font=FONT_SIZES[14])
+        """Draw a room name label centered at the specified position."""
+        # Draw text on its background
+        label = render_label(text, 14, TEXT_COLOR)
+        img.paste(label, (x - label.width // 2, y - label.height // 2))
 
     def _draw_zones(
-        self, img: Image.Image, offset_x: float, offset_y: float, scale: float
-    ) -> Image.Image:
-        """Draw keepout zones, clean zones, and observed zones on the map."""
-        current_img = img
-
-        # Draw keepout zones (red)
-        for zone in self._keepout_zones:
-            current_img = self._draw_zone_polygon(
-                current_img,
-                zone,
-                offset_x,
-                offset_y,
-                scale,
-                KEEPOUT_ZONE_COLOR[:3],
-                KEEPOUT_ZONE_BORDER,
-                "KEEP OUT",
-            )
-
-        # Draw clean zones (green)
-        for zone in self._clean_zones:
-            zone_name = zone.get("name", "Clean Zone")
-            current_img = self._draw_zone_polygon(
-                current_img,
-                zone,
-                offset_x,
-                offset_y,
-                scale,
-                CLEAN_ZONE_COLOR[:3],
-                CLEAN_ZONE_BORDER,
-                zone_name,
-            )
-
-        # Draw observed zones (orange)
-        for zone in self._observed_zones:
-            zone_name = zone.get("name", "Observed")
-            current_img = self._draw_zone_polygon(
-                current_img,
-                zone,
-                offset_x,
-                offset_y,
-                scale,
-                OBSERVED_ZONE_COLOR[:3],
-                OBSERVED_ZONE_BORDER,
-                zone_name,
-            )
-
-        return current_img
-
-    def _draw_zone_polygon(
         self,
         img: Image.Image,
-        zone: dict[str, Any],
-        offset_x: float,
-        offset_y: float,
-        scale: float,
-        fill_color: tuple[int, int, int],
-        border_color: tuple[int, int, int],
-        label: str,
-    ) -> Image.Image:
-        """Draw a single zone polygon."""
-        if "geometry" not in zone:
-            return img
-
-        geometry = zone["geometry"]
-        if geometry.get("type") != "polygon":
-            return img
-
-        # Get coordinates by ID references
-        polygon_ids = geometry.get("ids", [])
-        current_img = img
-
-        for polygon_id_list in polygon_ids:
-            if not isinstance(polygon_id_list, list):
-                continue
-
-            # Find coordinates for this polygon
-            polygon_coords = []
-            for coord_id in polygon_id_list:
-                coord = self._find_coordinate_by_id(coord_id)
-                if coord:
-                    # Transform coordinate to image space
-                    x = coord[0] * scale + offset_x
-                    y = MAP_HEIGHT - (coord[1] * scale + offset_y)  # Flip Y axis
-                    polygon_coords.append((x, y))
-
-            if len(polygon_coords) >= 3:  # Need at least 3 points for polygon
-                # Check if this is a keepout zone to apply transparency
-                is_keepout = label in {"KEEP OUT", "Observed"}
-
-                if is_keepout:
-                    # Draw semi-transparent keepout zone using overlay technique
-                    current_img = self._draw_transparent_polygon(
-                        current_img, polygon_coords, fill_color, border_color
-                    )
-                else:
-                    # For other zones, use dashed border style
-                    draw = ImageDraw.Draw(current_img)
-                    self._draw_dashed_polygon(draw, polygon_coords, border_color, 3)
-
-                # Draw zone label
-                if polygon_coords and label:
-                    # Calculate centroid for label placement
-                    x_sum = sum(coord[0] for coord in polygon_coords)
-                    y_sum = sum(coord[1] for coord in polygon_coords)
-                    centroid_x = x_sum / len(polygon_coords)
-                    centroid_y = y_sum / len(polygon_coords)
-
-                    draw = ImageDraw.Draw(current_img)
-                    self._draw_zone_label(
-                        draw, centroid_x, centroid_y, label, border_color
-                    )
-
-        return current_img
-
-    def _draw_transparent_polygon(
-        self,
-        base_img: Image.Image,
-        coords: list[tuple[float, float]],
-        fill_color: tuple[int, int, int],
-        border_color: tuple[int, int, int],
-    ) -> Image.Image:
-        """Draw a semi-transparent polygon by creating an overlay and blending.
-
-        Returns the blended image that should replace the original.
-        """
-        if len(coords) < 3:
-            return base_img
-
-        # Create a transparent overlay
-        overlay = Image.new("RGBA", base_img.size, (0, 0, 0, 0))
-        overlay_draw = ImageDraw.Draw(overlay)
-
-        # Draw the polygon on the overlay with transparency
-        transparent_fill = (*fill_color, 100)  # ~39% opacity
-        overlay_draw.polygon(
-            coords, fill=transparent_fill, outline=(*border_color, 255), width=2
-        )
-
-        # Convert base image to RGBA for blending
-        if base_img.mode != "RGBA":
-            base_rgba = base_img.convert("RGBA")
-        else:
-            base_rgba = base_img.copy()
-
-        # Blend the overlay with the base image
-        blended = Image.alpha_composite(base_rgba, overlay)
-
-        # Return the blended image in the original mode
-        if base_img.mode == "RGB":
-            return blended.convert("RGB")
-        return blended
-
-    def _draw_dashed_polygon(
-        self,
         draw: ImageDraw.ImageDraw,
-        coords: list[tuple[float, float]],
-        color: tuple,
-        width: int,
+        zone_shapes: list[dict[str, Any]],
     ) -> None:
-        """Draw a dashed polygon outline."""
-        if len(coords) < 3:
-            return
-
-        # Draw dashed lines between consecutive points
-        for i in range(len(coords)):
-            start = coords[i]
-            end = coords[(i + 1) % len(coords)]
+        """Draw keepout zones, clean zones, and observed zones on the map.
 
-            # Calculate distance and draw dashed line
-            dx = end[0] - start[0]
-            dy = end[1] - start[1]
-            distance = (dx**2 + dy**2) ** 0.5
-
-            if distance > 0:
-                # Draw dashes every 10 pixels
-                dash_length = 10
-                gap_length = 5
-                total_length = dash_length + gap_length
-
-                steps = int(distance / total_length)
-                for step in range(steps):
-                    t1 = step * total_length / distance
-                    t2 = min((step * total_length + dash_length) / distance, 1.0)
-
-                    x1 = start[0] + t1 * dx
-                    y1 = start[1] + t1 * dy
-                    x2 = start[0] + t2 * dx
-                    y2 = start[1] + t2 * dy
+        Transparent zone fills share one overlay that is blended in a single
+        pass; labels are drawn on top afterwards.
+        """
+        transparent: list[TransparentPolygon] = []
+        labels: list[ZoneLabel] = []
+
+        # Keepout, clean, and observed zones, in that order
+        for zone in zone_shapes:
+            self._draw_zone_polygon(draw, zone, transparent, labels)
+
+        if transparent:
+            overlay = Image.new("RGBA", img.size, (0, 0, 0, 0))
+            overlay_draw = ImageDraw.Draw(overlay)
+            for coords, fill_color, border_color in transparent:
+                overlay_draw.polygon(
+                    coords,
+                    fill=(*fill_color, 100),  # ~39% opacity
+                    outline=(*border_color, 255),
+                    width=2,
+                )
+            # Blend in place using the overlay's own alpha as the mask
+            img.paste(overlay, (0, 0), overlay)
 
-                    draw.line([(x1, y1), (x2, y2)], fill=color, width=width)
+        for x, y, label, color in labels:
+            self._draw_zone_label(img, x, y, label, color)
 
-    def _draw_dashed_line(
+    def _draw_zone_polygon(
         self,
         draw: ImageDraw.ImageDraw,
-        start: tuple[float, float],
-        end: tuple[float, float],
-        color: tuple[int, int, int],
-        width: int = 2,
-        dash_length: int = 10,
+        zone: dict[str, Any],
+        transparent: list[TransparentPolygon],
+        labels: list[ZoneLabel],
     ) -> None:
-        """Draw a dashed line between two points."""
-        x1, y1 = start
-        x2, y2 = end
-
-        # Calculate line length and direction
-        dx = x2 - x1
-        dy = y2 - y1
-        length = (dx * dx + dy * dy) ** 0.5
-
-        if length == 0:
-            return
-
-        # Normalize direction
-        dx_norm = dx / length
-        dy_norm = dy / length
-
-        # Draw dashes
-        current_pos = 0
-        while current_pos < length:
-            # Calculate dash start and end
-            dash_start_x = x1 + dx_norm * current_pos
-            dash_start_y = y1 + dy_norm * current_pos
-
-            dash_end_pos = min(current_pos + dash_length, length)
-            dash_end_x = x1 + dx_norm * dash_end_pos
-            dash_end_y = y1 + dy_norm * dash_end_pos
-
-            # Draw the dash
-            draw.line(
-                [(dash_start_x, dash_start_y), (dash_end_x, dash_end_y)],
-                fill=color,
-                width=width,
+        """Draw a single zone's polygons, queueing transparent fills and labels."""
+        fill_color = zone["fill"]
+        border_color = zone["border"]
+        label = zone["label"]
+
+        if zone["transparent"]:
+            transparent.extend(
+                (polygon_coords, fill_color, border_color)
+                for polygon_coords, _, _ in zone["polygons"]
             )
+        else:
+            # For other zones, use dashed border style
+            line = draw.line
+            for dash in zone["dashes"]:
+                line(dash, fill=border_color, width=3)
+
+        # Queue zone labels
+        if label:
+            for polygon_coords, x_sum, y_sum in zone["polygons"]:
+                # Place the label at the polygon's centroid
+                count = len(polygon_coords)
+                labels.append((x_sum // count, y_sum // count, label, border_color))
+
+    @staticmethod
+    def _dash_segments(
+        coords: list[tuple[int, int]],
+    ) -> list[list[tuple[float, float]]]:
+        """Return the dash segments of a dashed polygon outline."""
+        # Dashes every 15 pixels: 10px dash, 5px gap
+        dash_length = 10
+        gap_length = 5
+        total_length = dash_length + gap_length
+        dashes = []
+
+        # Dashes between consecutive points
+        for (x0, y0), (x1, y1) in zip(coords, [*coords[1:], coords[0]]):
+            dx = x1 - x0
+            dy = y1 - y0
+            distance = math.hypot(dx, dy)
+            if distance <= 0:
+                continue
 
-            # Move to next dash (skip gap)
-            current_pos += dash_length * 2
+            # Per-pixel step along the edge; whole dashes always end before
+            # the next point, so no dash needs clamping
+            ux = dx / distance
+            uy = dy / distance
+            for step in range(int(distance / total_length)):
+                start = step * total_length
+                end = start + dash_length
+                dashes.append(
+                    [(x0 + start * ux, y0 + start * uy), (x0 + end * ux, y0 + end * uy)]
+                )
+        return dashes
 
     def _draw_zone_label(
         self,
-        draw: ImageDraw.ImageDraw,
-        x: float,
-        y: float,
+        img: Image.Image,
+        x: int,
+        y: int,
         text: str,
         color: tuple[int, int, int],
     ) -> None:
-        """Draw a zone label at the specified position."""
-
-        bbox = draw.textbbox((0, 0), text, font=FONT_SIZES[12])
-        text_width = bbox[2] - bbox[0]
-        text_height = bbox[3] - bbox[1]
-
-        # Center the text
-        text_x = x - text_width / 2
-        text_y = y - text_height / 2
-
-        # Draw text background (semi-transparent white)
-        draw.rectangle(
-            [text_x - 2, text_y - 2, text_x + text_width + 2, text_y + text_height + 2],
-            fill=(255, 255, 255, 200),
-        )
-
-        # Draw text
-        draw.text((text_x, text_y), text, fill=color, font=FONT_SIZES[12])
+        """Draw a zone label centered at the specified position."""
+        label = render_label(text, 12, color)
+        img.paste(label, (x - label.width // 2, y - label.height // 2))
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
@@ -621,142 +642,47 @@ class RoombaMapCamera(Camera):
             "rooms": self.rooms,
         }
 
-    @property
+    @cached_property
     def rooms(self) -> dict[str, dict[str, Any]] | None:
         """Return rooms configuration for vacuum card integration."""
-        if not self._regions or not self._points2d:
-            return None
-
-        # Calculate map bounds and scaling (same as calibration)
-        all_coords = [
-            point["coordinates"]
-            for point in self._points2d
-            if "coordinates" in point and len(point["coordinates"]) >= 2
-        ]
-
-        if not all_coords:
-            return None
-
-        # Find min/max coordinates to determine map bounds
-        x_coords = [coord[0] for coord in all_coords]
-        y_coords = [coord[1] for coord in all_coords]
-
-        min_x, max_x = min(x_coords), max(x_coords)
-        min_y, max_y = min(y_coords), max(y_coords)
-
-        map_width = max_x - min_x
-        map_height = max_y - min_y
-
-        if map_width <= 0 or map_height <= 0:
-            return None
-
-        # Calculate scale to fit image (same as in _render_map)
-        scale_x = (MAP_WIDTH - 40) / map_width
-        scale_y = (MAP_HEIGHT - 40) / map_height
-        scale = min(scale_x, scale_y)
-
-        # Center the map (same as in _render_map)
-        offset_x = (MAP_WIDTH - map_width * scale) / 2 - min_x * scale
-        offset_y = (MAP_HEIGHT - map_height * scale) / 2 - min_y * scale
-
         rooms_dict = {}
 
-        for i, region in enumerate(self._regions):
-            if "geometry" not in region:
-                continue
-
-            geometry = region["geometry"]
-            if geometry.get("type") != "polygon":
-                continue
+        for room in self._room_shapes:
+            # Outline of all polygons for this room
+            polygons = room["polygons"]
+            room_outline = [
+                [x, y] for polygon_coords, _, _ in polygons for x, y in polygon_coords
+            ]
 
-            # Get coordinates by ID references
-            polygon_ids = geometry.get("ids", [])
-            room_id = region.get("region_id", str(i))
-            room_name = region.get("name", f"Room {i + 1}")
+            # Center point for icon/label placement, from the polygon sums
+            center_x = sum(polygon[1] for polygon in polygons) // len(room_outline)
+            center_y = sum(polygon[2] for polygon in polygons) // len(room_outline)
 
-            # Process all polygons for this room to get outline
-            room_outline = []
-            for polygon_id_list in polygon_ids:
-                if not isinstance(polygon_id_list, list):
-                    continue
+            # Get the appropriate icon based on region type
+            icon = regionTypeMappings.get(
+                room["region_type"], regionTypeMappings.get("default")
+            )
 
-                # Find coordinates for this polygon
-                polygon_coords = []
-                for coord_id in polygon_id_list:
-                    coord = self._find_coordinate_by_id(coord_id)
-                    if coord:
-                        # Transform coordinate to map image space
-                        img_x = coord[0] * scale + offset_x
-                        img_y = MAP_HEIGHT - (
-                            coord[1] * scale + offset_y
-                        )  # Flip Y axis
-                        polygon_coords.append([int(img_x), int(img_y)])
-
-                if len(polygon_coords) >= 3:
-                    room_outline.extend(polygon_coords)
-
-            if room_outline:
-                # Calculate center point for icon/label placement
-                x_sum = sum(coord[0] for coord in room_outline)
-                y_sum = sum(coord[1] for coord in room_outline)
-                center_x = int(x_sum / len(room_outline))
-                center_y = int(y_sum / len(room_outline))
-
-                # Get the appropriate icon based on region type
-                region_type = region.get("region_type", "default")
-                icon = regionTypeMappings.get(
-                    region_type, regionTypeMappings.get("default")
-                )
-
-                # Create room configuration similar to the vacuum card format
-                rooms_dict[room_id] = {
-                    "name": room_name,
-                    "icon": icon,
-                    "x": center_x,
-                    "y": center_y,
-                    "outline": room_outline,
-                }
+            # Create room configuration similar to the vacuum card format
+            rooms_dict[room["id"]] = {
+                "name": room["name"],
+                "icon": icon,
+                "x": center_x,
+                "y": center_y,
+                "outline": room_outline,
+            }
 
         return rooms_dict if rooms_dict else None
 
-    @property
+    @cached_property
     def calibration(self) -> list[dict[str, dict[str, int]]] | None:
         """Return calibration points for vacuum card integration."""
-        if not self._points2d or not self._regions:
-            return None
-
-        # Calculate map bounds from points2d
-        all_coords = [
-            point["coordinates"]
-            for point in self._points2d
-            if "coordinates" in point and len(point["coordinates"]) >= 2
-        ]
-
-        if not all_coords:
+        if not self._regions or not self._transform:
             return None
-
-        # Find min/max coordinates to determine map bounds
-        x_coords = [coord[0] for coord in all_coords]
-        y_coords = [coord[1] for coord in all_coords]
-
-        min_x, max_x = min(x_coords), max(x_coords)
-        min_y, max_y = min(y_coords), max(y_coords)
-
+        min_x, max_x, min_y, max_y, scale, offset_x, offset_y = self._transform
         map_width = max_x - min_x
         map_height = max_y - min_y
 
-        if map_width <= 0 or map_height <= 0:
-            return None
-
-        # Calculate scale to fit image (same as in _render_map)
-        scale_x = (MAP_WIDTH - 40) / map_width
-        scale_y = (MAP_HEIGHT - 40) / map_height
-        scale = min(scale_x, scale_y)
-
-        # Center the map (same as in _render_map)
-        offset_x = (MAP_WIDTH - map_width * scale) / 2 - min_x * scale
-        offset_y = (MAP_HEIGHT - map_height * scale) / 2 - min_y * scale
-
         # Define calibration center and differential (similar to built-in method)
         # Use center of the vacuum coordinate space
         calibration_center_x = (min_x + max_x) / 2
@@ -83,7 +83,11 @@ class RoombaConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             if data == {}:
                 raise ValueError("No data returned from device")
 
-            unique_id = hashlib.md5(user_input["base_url"].encode()).hexdigest()[:8]
+            # Existing entries and their devices are keyed by this MD5 prefix,
+            # so the hash must stay; it is an identifier, not a security check
+            unique_id = hashlib.md5(
+                user_input["base_url"].encode(), usedforsecurity=False
+            ).hexdigest()[:8]
 
             await self.async_set_unique_id(unique_id)
             self._abort_if_unique_id_configured()
@@ -2,9 +2,17 @@
 
 from datetime import timedelta
 
+import aiohttp
+
 DOMAIN = "roomba_rest980"
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=10)  # or whatever interval you want
 
+# rest980 lives on the local network, fail fast instead of hanging a command
+REST980_TIMEOUT = aiohttp.ClientTimeout(total=15, connect=5)
+# State polls repeat every scan interval, so give up sooner than commands
+REST980_POLL_TIMEOUT = aiohttp.ClientTimeout(total=10)
+JSON_HEADERS = {"content-type": "application/json"}
+
 notReadyMappings = {
     0: "n-a",
     2: "Uneven Ground",
@@ -1,21 +1,25 @@
 """Data update coordinator for Roomba REST980."""
 
 import asyncio
+from collections.abc import Callable
 import logging
 
 import aiohttp
+from aiohttp import hdrs
+from yarl import URL
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.update_coordinator import (
     ConfigEntryAuthFailed,
     DataUpdateCoordinator,
     UpdateFailed,
 )
+from homeassistant.util.json import json_loads
 
 from .CloudApi import iRobotCloudApi, AuthenticationError, CloudApiError
-from .const import DEFAULT_SCAN_INTERVAL
+from .const import DEFAULT_SCAN_INTERVAL, REST980_POLL_TIMEOUT
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -34,6 +38,12 @@ class RoombaDataCoordinator(DataUpdateCoordinator):
         )
         self.session = async_get_clientsession(hass)  # Use HA’s shared session
         self.url = config_entry.data["base_url"]
+        # Parsed once; aiohttp would re-parse a str URL on every poll
+        self._state_url = URL(f"{self.url}/api/local/info/state")
+        # ETag of the last state payload, sent back as If-None-Match
+        self._etag: str | None = None
+        # Computed once per refresh and shared by every sensor
+        self.mission_active = False
 
     async def _async_update_data(self):
         """Fetch data from API endpoint.
@@ -44,18 +54,38 @@ class RoombaDataCoordinator(DataUpdateCoordinator):
         try:
             # Note: asyncio.TimeoutError and aiohttp.ClientError are already
             # handled by the data update coordinator.
-            async with asyncio.timeout(10):
-                async with self.session.get(f"{self.url}/api/local/info/state") as resp:
-                    resp.raise_for_status()
-                    return await resp.json()
+            headers = None
+            if self._etag and self.data is not None:
+                headers = {hdrs.IF_NONE_MATCH: self._etag}
+            async with self.session.get(
+                self._state_url, headers=headers, timeout=REST980_POLL_TIMEOUT
+            ) as resp:
+                if resp.status == 304:
+                    # rest980 (Express) answers 304 when the state is unchanged
+                    return self.data
+                resp.raise_for_status()
+                # orjson straight from the bytes, skipping the str decode
+                data = json_loads(await resp.read())
+                self._etag = resp.headers.get(hdrs.ETAG)
         except (aiohttp.ClientError, TimeoutError) as err:
             raise UpdateFailed(f"Error communicating with API: {err}") from err
 
+        status = data.get("cleanMissionStatus") or {}
+        # A mission is running once started, unless it is parked on a full charge
+        self.mission_active = bool(status.get("mssnStrtTm")) and not (
+            status.get("phase") == "charge" and data.get("batPct") == 100
+        )
+        return data
+
 
 class RoombaCloudCoordinator(DataUpdateCoordinator):
     """Data coordinator for Roomba REST980 integration."""
 
     api: iRobotCloudApi
+    # (sku, softwareVer, name) -> BLID, used to match the local robot
+    blid_by_signature: dict[tuple, str]
+    # Number of enabled FavoriteButton entities reading the favorites
+    favorite_consumers: int
 
     def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry) -> None:
         """Initialize my coordinator."""
@@ -70,16 +100,58 @@ class RoombaCloudCoordinator(DataUpdateCoordinator):
         self.password = config_entry.data["irobot_password"]
         self.session = async_get_clientsession(hass)
         self.api = iRobotCloudApi(self.username, self.password, self.session)
-
-    async def _async_setup(self):
-        try:
-            await self.api.authenticate()
-        except (AuthenticationError, CloudApiError) as err:
-            raise ConfigEntryAuthFailed(f"Cloud API error: {err}") from err
+        self.blid_by_signature = {}
+        self.favorite_consumers = 0
+        # Set once the first cloud refresh and BLID matching have finished
+        self.ready = asyncio.Event()
+
+    @callback
+    def async_run_when_ready(self, job: Callable[[], None]) -> None:
+        """Run job now if the cloud data is ready, otherwise once it is."""
+        if self.ready.is_set():
+            job()
+            return
+
+        async def _wait_for_ready() -> None:
+            await self.ready.wait()
+            job()
+
+        self.config_entry.async_create_background_task(
+            self.hass, _wait_for_ready(), "roomba_cloud_platform_setup"
+        )
 
     async def _async_update_data(self):
+        # Log in on the first refresh; it runs in the background after startup,
+        # so DataUpdateCoordinator._async_setup would never be called
+        if not self.api.credentials:
+            try:
+                await self.api.authenticate()
+            except (AuthenticationError, CloudApiError) as err:
+                raise ConfigEntryAuthFailed(f"Cloud API error: {err}") from err
+
+        # Favorites only feed the favorite buttons; after the first refresh,
+        # skip that cloud call while none of them is enabled
+        fetch_favorites = self.data is None or self.favorite_consumers > 0
         try:
             async with asyncio.timeout(10):
-                return await self.api.get_all_robots_data()
+                data = await self.api.get_all_robots_data(fetch_favorites)
         except (aiohttp.ClientError, TimeoutError) as err:
             raise UpdateFailed(f"Error communicating with API: {err}") from err
+        if not fetch_favorites:
+            data["favorites"] = self.data.get("favorites", {})
+
+        blid_by_signature = {}
+        for blid, robot in data.items():
+            if not isinstance(robot, dict) or not robot.get("robot_info"):
+                continue
+            robot_info = robot["robot_info"]
+            blid_by_signature.setdefault(
+                (
+                    robot_info.get("sku"),
+                    robot_info.get("softwareVer"),
+                    robot_info.get("name"),
+                ),
+                blid,
+            )
+        self.blid_by_signature = blid_by_signature
+        return data
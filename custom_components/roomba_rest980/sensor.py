@@ -4,8 +4,7 @@ import logging
 
 from homeassistant.components.sensor import SensorDeviceClass
 from homeassistant.const import PERCENTAGE, UnitOfArea, UnitOfTime
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import EntityCategory
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.util import dt as dt_util
 
 from .const import (
@@ -27,28 +26,35 @@ async def async_setup_entry(hass: HomeAssistant, entry, async_add_entities):
     coordinator = entry.runtime_data.local_coordinator
     cloudCoordinator = entry.runtime_data.cloud_coordinator
 
-    # Create cloud pmap entities if cloud data is available
-    cloud_entities = []
-    if cloudCoordinator and cloudCoordinator.data:
-        blid = entry.runtime_data.robot_blid
-        # Get cloud data for the specific robot
-        if blid in cloudCoordinator.data:
-            cloud_data = cloudCoordinator.data[blid]
-            # Create pmap entities from cloud data
-            if "pmaps" in cloud_data:
-                for pmap in cloud_data["pmaps"]:
-                    try:
-                        cloud_entities.append(
-                            RoombaCloudPmap(cloudCoordinator, entry, pmap)
-                        )
-                    except (KeyError, TypeError) as e:
-                        _LOGGER.warning(
-                            "Failed to create pmap entity for %s: %s",
-                            pmap.get("pmap_id", "unknown"),
-                            e,
-                        )
-    if cloud_entities:
+    @callback
+    def _async_add_cloud_sensors() -> None:
+        cloud_entities = [RoombaCloudAttributes(cloudCoordinator, entry)]
+        # Create cloud pmap entities if cloud data is available
+        if cloudCoordinator.data:
+            blid = entry.runtime_data.robot_blid
+            # Get cloud data for the specific robot
+            if blid in cloudCoordinator.data:
+                cloud_data = cloudCoordinator.data[blid]
+                # Create pmap entities from cloud data
+                if "pmaps" in cloud_data:
+                    for pmap in cloud_data["pmaps"]:
+                        try:
+                            cloud_entities.append(
+                                RoombaCloudPmap(cloudCoordinator, entry, pmap)
+                            )
+                        except (KeyError, TypeError) as e:
+                            _LOGGER.warning(
+                                "Failed to create pmap entity for %s: %s",
+                                pmap.get("pmap_id", "unknown"),
+                                e,
+                            )
         async_add_entities(cloud_entities)
+
+    if cloudCoordinator:
+        # Added once the background cloud setup has finished, so adding them
+        # never refreshes the cloud coordinator during platform setup
+        cloudCoordinator.async_run_when_ready(_async_add_cloud_sensors)
+
     async_add_entities(
         [
             RoombaAttributes(coordinator, entry),
@@ -69,7 +75,6 @@ async def async_setup_entry(hass: HomeAssistant, entry, async_add_entities):
             RoombaCleanMode(coordinator, entry),
             RoombaNotReady(coordinator, entry),
             RoombaError(coordinator, entry),
-            RoombaCloudAttributes(cloudCoordinator, entry),
             MopCleanMode(coordinator, entry),
             MopBehavior(coordinator, entry),
             MopPad(coordinator, entry),
@@ -89,7 +94,6 @@ class MopCleanMode(RoombaSensor):
         super().__init__(coordinator, entry)
         self._attr_device_class = SensorDeviceClass.ENUM
         # self._attr_options = list(cleanBaseMappings.values()) #TODO: Update with real value list
-        self._attr_entity_category = EntityCategory.DIAGNOSTIC
         self._attr_icon = "mdi:auto-mode"
 
     def _handle_coordinator_update(self):
@@ -115,7 +119,6 @@ class MopBehavior(RoombaSensor):
         super().__init__(coordinator, entry)
         self._attr_device_class = SensorDeviceClass.ENUM
         self._attr_options = list(mopRanks.values())
-        self._attr_entity_category = EntityCategory.DIAGNOSTIC
         self._attr_icon = "mdi:shimmer"
 
     def _handle_coordinator_update(self):
@@ -140,7 +143,6 @@ class MopPad(RoombaSensor):
         super().__init__(coordinator, entry)
         self._attr_device_class = SensorDeviceClass.ENUM
         self._attr_options = list(padMappings.values())
-        self._attr_entity_category = EntityCategory.DIAGNOSTIC
         self._attr_icon = "mdi:shimmer"
 
     def _handle_coordinator_update(self):
@@ -165,7 +167,6 @@ class MopTank(RoombaSensor):
         super().__init__(coordinator, entry)
         self._attr_device_class = SensorDeviceClass.ENUM
         self._attr_options = list(padMappings.values())
-        self._attr_entity_category = EntityCategory.DIAGNOSTIC
         self._attr_icon = "mdi:shimmer"
 
     def _handle_coordinator_update(self):
@@ -202,32 +203,24 @@ class RoombaBatterySensor(RoombaSensor):
         """Create a new battery level sensor."""
         super().__init__(coordinator, entry)
         self._attr_native_unit_of_measurement = PERCENTAGE
-        self._attr_entity_category = EntityCategory.DIAGNOSTIC
 
     def _handle_coordinator_update(self):
         """Update sensor when coordinator data changes."""
         data = self.coordinator.data or {}
-        self._attr_native_value = data.get("batPct", 0)
-        self.async_write_ha_state()
-
-    @property
-    def extra_state_attributes(self):
-        """Return all the attributes returned by rest980."""
-        return self._get_default("batInfo", {})
-
-    @property
-    def icon(self):
-        """Return a dynamic icon based on battery percentage."""
-        batLevel = self.native_value or 0
+        batLevel = data.get("batPct", 0)
+        self._attr_native_value = batLevel
+        self._attr_extra_state_attributes = self._get_default("batInfo", {})
+        # Dynamic icon based on battery percentage
+        batLevel = batLevel or 0
         if batLevel >= 95:
-            return "mdi:battery"
-        if batLevel >= 60:
-            return "mdi:battery-60"
-        if batLevel >= 30:
-            return "mdi:battery-30"
-        if batLevel < 30:
-            return "mdi:battery-alert"
-        return "mdi:battery"
+            self._attr_icon = "mdi:battery"
+        elif batLevel >= 60:
+            self._attr_icon = "mdi:battery-60"
+        elif batLevel >= 30:
+            self._attr_icon = "mdi:battery-30"
+        else:
+            self._attr_icon = "mdi:battery-alert"
+        self.async_write_ha_state()
 
 
 class RoombaAttributes(RoombaSensor):
@@ -243,16 +236,12 @@ class RoombaAttributes(RoombaSensor):
 
     def _handle_coordinator_update(self):
         """Update sensor when coordinator data changes."""
-        self._attr_native_value = (
-            "Available" if self.coordinator.data else "Unavailable"
-        )
+        data = self.coordinator.data
+        self._attr_native_value = "Available" if data else "Unavailable"
+        # All the attributes returned by rest980
+        self._attr_extra_state_attributes = data or {}
         self.async_write_ha_state()
 
-    @property
-    def extra_state_attributes(self):
-        """Return all the attributes returned by rest980."""
-        return self.coordinator.data or {}
-
 
 class RoombaCloudAttributes(RoombaCloudSensor):
     """A simple sensor that returns all given datapoints without modification."""
@@ -267,16 +256,14 @@ class RoombaCloudAttributes(RoombaCloudSensor):
 
     def _handle_coordinator_update(self):
         """Update sensor when coordinator data changes."""
-        self._attr_native_value = (
-            "Available" if self.coordinator.data else "Unavailable"
+        data = self.coordinator.data
+        self._attr_native_value = "Available" if data else "Unavailable"
+        # All the attributes returned by iRobot's cloud
+        self._attr_extra_state_attributes = (
+            (data.get(self._entry.runtime_data.robot_blid) or {}) if data else {}
         )
         self.async_write_ha_state()
 
-    @property
-    def extra_state_attributes(self):
-        """Return all the attributes returned by iRobot's cloud."""
-        return self.coordinator.data.get(self._entry.runtime_data.robot_blid) or {}
-
 
 class RoombaCloudPmap(RoombaCloudSensor):
     """Sensor for Roomba persistent map (pmap) data from cloud."""
@@ -290,8 +277,19 @@ class RoombaCloudPmap(RoombaCloudSensor):
 
         self._rs_given_info = (pmap_name, pmap_id)
         super().__init__(coordinator, entry)
+        self._pmap_id = pmap.get("pmap_id")
         self._attr_extra_state_attributes = pmap
 
+    def _handle_coordinator_update(self):
+        """Update sensor when coordinator data changes."""
+        data = self.coordinator.data or {}
+        robot_data = data.get(self._entry.runtime_data.robot_blid) or {}
+        for pmap in robot_data.get("pmaps") or []:
+            if pmap.get("pmap_id") == self._pmap_id:
+                self._attr_extra_state_attributes = pmap
+                break
+        self.async_write_ha_state()
+
 
 class RoombaPhase(RoombaSensor):
     """A simple sensor that returns the phase of the Roomba."""
@@ -303,7 +301,6 @@ class RoombaPhase(RoombaSensor):
         super().__init__(coordinator, entry)
         self._attr_device_class = SensorDeviceClass.ENUM
         self._attr_options = list(phaseMappings.values())
-        self._attr_entity_category = EntityCategory.DIAGNOSTIC
 
     def _handle_coordinator_update(self):
         """Update sensor when coordinator data changes."""
@@ -321,21 +318,13 @@ class RoombaPhase(RoombaSensor):
         else:
             rPhase = phaseMappings.get(phase, "Unknown")
         self._attr_native_value = rPhase
+        self._attr_icon = (
+            "mdi:progress-alert"
+            if cycle == "none" and phase == "stop"
+            else "mdi:progress-helper"
+        )
         self.async_write_ha_state()
 
-    @property
-    def icon(self):
-        """Return the current phase of the Roomba."""
-        data = self.coordinator.data or {}
-        status = data.get("cleanMissionStatus", {})
-        # Mission State
-        cycle = status.get("cycle")
-        phase = status.get("phase")
-
-        if cycle == "none" and phase == "stop":
-            return "mdi:progress-alert"
-        return "mdi:progress-helper"
-
 
 class RoombaCleanBase(RoombaSensor):
     """A simple sensor that returns the phase of the Roomba."""
@@ -347,7 +336,6 @@ class RoombaCleanBase(RoombaSensor):
         super().__init__(coordinator, entry)
         self._attr_device_class = SensorDeviceClass.ENUM
         self._attr_options = list(cleanBaseMappings.values())
-        self._attr_entity_category = EntityCategory.DIAGNOSTIC
         self._attr_icon = "mdi:trash-can"
 
     def _handle_coordinator_update(self):
@@ -369,20 +357,13 @@ class RoombaBinSensor(RoombaSensor):
         super().__init__(coordinator, entry)
         self._attr_device_class = SensorDeviceClass.ENUM
         self._attr_options = ["Not Full", "Full"]
-        self._attr_entity_category = EntityCategory.DIAGNOSTIC
 
     def _handle_coordinator_update(self):
         """Update sensor when coordinator data changes."""
-        self._attr_native_value = (
-            "Full" if self._get_default("bin", {}).get("full") else "Not Full"
-        )
-        self.async_write_ha_state()
-
-    @property
-    def icon(self):
-        """Return a dynamic icon based on bin being full or not."""
         full: bool = self._get_default("bin", {}).get("full")
-        return "mdi:trash-can-outline" if not full else "mdi:trash-can"
+        self._attr_native_value = "Full" if full else "Not Full"
+        self._attr_icon = "mdi:trash-can-outline" if not full else "mdi:trash-can"
+        self.async_write_ha_state()
 
 
 class RoombaJobInitiator(RoombaSensor):
@@ -395,7 +376,6 @@ class RoombaJobInitiator(RoombaSensor):
         super().__init__(coordinator, entry)
         self._attr_device_class = SensorDeviceClass.ENUM
         self._attr_options = list(jobInitiatorMappings.values())
-        self._attr_entity_category = EntityCategory.DIAGNOSTIC
         self._attr_icon = "mdi:cursor-pointer"
 
     def _handle_coordinator_update(self):
@@ -689,7 +669,6 @@ class RoombaTotalArea(RoombaSensor):
         super().__init__(coordinator, entry)
         self._attr_device_class = SensorDeviceClass.AREA
         self._attr_native_unit_of_measurement = UnitOfArea.SQUARE_METERS
-        self._attr_entity_category = EntityCategory.DIAGNOSTIC
         self._attr_icon = "mdi:texture-box"
 
     def _handle_coordinator_update(self):
@@ -711,7 +690,6 @@ class RoombaTotalTime(RoombaSensor):
         super().__init__(coordinator, entry)
         self._attr_device_class = SensorDeviceClass.DURATION
         self._attr_native_unit_of_measurement = UnitOfTime.MINUTES
-        self._attr_entity_category = EntityCategory.DIAGNOSTIC
         self._attr_icon = "mdi:clock-time-five"
 
     def _handle_coordinator_update(self):
@@ -733,7 +711,6 @@ class RoombaTotalJobs(RoombaSensor):
         """Create a new job initiator reading."""
         super().__init__(coordinator, entry)
         self._attr_native_unit_of_measurement = UnitOfTime.MINUTES
-        self._attr_entity_category = EntityCategory.DIAGNOSTIC
         self._attr_icon = "mdi:transmission-tower"
 
     def _handle_coordinator_update(self):
@@ -0,0 +1,74 @@
+"""Services for the Roomba rest980 integration."""
+
+import logging
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .const import DOMAIN, JSON_HEADERS, REST980_TIMEOUT
+
+_LOGGER = logging.getLogger(__name__)
+
+_CLEAN_SCHEMA = vol.Schema(
+    {vol.Required("payload"): dict, vol.Required("base_url"): str}
+)
+_ACTION_SCHEMA = vol.Schema(
+    {vol.Required("action"): str, vol.Required("base_url"): str}
+)
+
+
+async def async_send_clean(hass: HomeAssistant, base_url: str, payload: dict) -> None:
+    """Send a cleanRoom command to rest980."""
+    # Home Assistant's shared session pools keep-alive connections to rest980
+    session = async_get_clientsession(hass)
+    try:
+        async with session.post(
+            f"{base_url}/api/local/action/cleanRoom",
+            headers=JSON_HEADERS,
+            json=payload,
+            timeout=REST980_TIMEOUT,
+        ) as response:
+            if response.status != 200:
+                _LOGGER.error("Failed to send clean command: %s", response.status)
+            else:
+                _LOGGER.debug("Clean command sent successfully")
+    except Exception as e:  # pylint: disable=broad-except
+        _LOGGER.error("Error sending clean command: %s", e)
+
+
+async def async_send_action(hass: HomeAssistant, base_url: str, action: str) -> None:
+    """Send a simple action (start, stop, dock, ...) to rest980."""
+    session = async_get_clientsession(hass)
+    try:
+        async with session.get(
+            f"{base_url}/api/local/action/{action}",
+            timeout=REST980_TIMEOUT,
+        ) as response:
+            if response.status != 200:
+                _LOGGER.error("Failed to send action %s: %s", action, response.status)
+            else:
+                _LOGGER.debug("Action sent successfully")
+    except Exception as e:  # pylint: disable=broad-except
+        _LOGGER.error("Error sending action %s: %s", action, e)
+
+
+def async_register_services(hass: HomeAssistant) -> None:
+    """Register integration services."""
+
+    async def _async_handle_vacuum_clean(call: ServiceCall) -> None:
+        """Handle vacuum clean service call."""
+        await async_send_clean(hass, call.data["base_url"], call.data["payload"])
+
+    async def _async_handle_action(call: ServiceCall) -> None:
+        """Handle action service call."""
+        await async_send_action(hass, call.data["base_url"], call.data["action"])
+
+    # Called once from async_setup, so the services cannot already exist
+    hass.services.async_register(
+        DOMAIN, "rest980_clean", _async_handle_vacuum_clean, _CLEAN_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN, "rest980_action", _async_handle_action, _ACTION_SCHEMA
+    )
@@ -3,10 +3,11 @@
 import logging
 
 from homeassistant.components.switch import SwitchEntity
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import EntityCategory
 
-from .const import DOMAIN, regionTypeMappings
+from .const import regionTypeMappings
+from .RoombaSensor import device_identifiers
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -14,49 +15,63 @@ _LOGGER = logging.getLogger(__name__)
 async def async_setup_entry(hass: HomeAssistant, entry, async_add_entities):
     """Create the switches to identify cleanable rooms."""
     cloudCoordinator = entry.runtime_data.cloud_coordinator
-    entities = []
-    if cloudCoordinator and cloudCoordinator.data:
-        blid = entry.runtime_data.robot_blid
-        # Get cloud data for the specific robot
-        if blid in cloudCoordinator.data:
-            cloud_data = cloudCoordinator.data[blid]
-            # Create pmap entities from cloud data
-            if "pmaps" in cloud_data:
-                for pmap in cloud_data["pmaps"]:
-                    try:
-                        for region in pmap["active_pmapv_details"]["regions"]:
-                            entities.append(
-                                RoomSwitch(
-                                    entry, region["name"] or "Unnamed Room", region
+    if not cloudCoordinator:
+        return
+
+    @callback
+    def _async_add_rooms() -> None:
+        entities = []
+        # Shared by every room switch of the entry
+        device_info = {
+            "identifiers": device_identifiers(entry.unique_id),
+            "name": entry.title,
+            "manufacturer": "iRobot",
+        }
+        if cloudCoordinator.data:
+            blid = entry.runtime_data.robot_blid
+            # Get cloud data for the specific robot
+            if blid in cloudCoordinator.data:
+                cloud_data = cloudCoordinator.data[blid]
+                # Create pmap entities from cloud data
+                if "pmaps" in cloud_data:
+                    for pmap in cloud_data["pmaps"]:
+                        try:
+                            for region in pmap["active_pmapv_details"]["regions"]:
+                                entities.append(
+                                    RoomSwitch(
+                                        entry,
+                                        region["name"] or "Unnamed Room",
+                                        region,
+                                        device_info,
+                                    )
                                 )
+                        except (KeyError, TypeError) as e:
+                            _LOGGER.warning(
+                                "Failed to create pmap entity for %s: %s",
+                                pmap.get("pmap_id", "unknown"),
+                                e,
                             )
-                    except (KeyError, TypeError) as e:
-                        _LOGGER.warning(
-                            "Failed to create pmap entity for %s: %s",
-                            pmap.get("pmap_id", "unknown"),
-                            e,
-                        )
-    for ent in entities:
-        entry.runtime_data.switched_rooms[f"switch.{ent.unique_id}"] = ent
-    async_add_entities(entities)
+        for ent in entities:
+            entry.runtime_data.switched_rooms[ent.unique_id] = ent
+        async_add_entities(entities)
+
+    # Rooms are only known once the background cloud setup has finished
+    cloudCoordinator.async_run_when_ready(_async_add_rooms)
 
 
 class RoomSwitch(SwitchEntity):
     """A switch entity to determine whether or not a room should be cleaned by the vacuum."""
 
-    def __init__(self, entry, name, data) -> None:
+    _attr_entity_category = EntityCategory.CONFIG
+
+    def __init__(self, entry, name, data, device_info) -> None:
         """Creates a switch entity for rooms."""
         self._attr_name = f"Clean {name}"
         self._attr_unique_id = f"{entry.unique_id}_{data['id']}"
         self._is_on = False
         self._room_json = {"region_id": data["id"], "type": "rid"}
-        self._attr_entity_category = EntityCategory.CONFIG
         self._attr_extra_state_attributes = data
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.unique_id)},
-            "name": entry.title,
-            "manufacturer": "iRobot",
-        }
+        self._attr_device_info = device_info
         # autodetect icon
         icon = regionTypeMappings.get(
             data["region_type"], regionTypeMappings.get("default")
@@ -12,8 +12,9 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
 from .LegacyCompatibility import createExtendedAttributes
+from .RoombaSensor import device_identifiers
+from .services import async_send_action, async_send_clean
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -186,7 +187,7 @@ class RoombaVacuum(CoordinatorEntity, StateVacuumEntity):
             model = "Roomba s9"
 
         return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.unique_id)},
+            identifiers=device_identifiers(self._entry.unique_id),
             name=data.get("name", "Roomba"),
             manufacturer="iRobot",
             model=model,
@@ -201,15 +202,7 @@ class RoombaVacuum(CoordinatorEntity, StateVacuumEntity):
         """Start cleaning floors, check if any are selected or just clean everything."""
         data = self.coordinator.data or {}
         if data.get("phase") == "stop":
-            await self.hass.services.async_call(
-                DOMAIN,
-                "rest980_action",
-                service_data={
-                    "action": "resume",
-                    "base_url": self._entry.data["base_url"],
-                },
-                blocking=True,
-            )
+            await async_send_action(self.hass, self._entry.data["base_url"], "resume")
             return
 
         try:
@@ -222,12 +215,8 @@ class RoombaVacuum(CoordinatorEntity, StateVacuumEntity):
             selected_rooms = []
 
             # Find all room switches that are turned on
-            for key, entity in domain_data.items():
-                if (
-                    key.startswith("switch.")
-                    and hasattr(entity, "is_on")
-                    and entity.is_on
-                ):
+            for entity in domain_data.values():
+                if hasattr(entity, "is_on") and entity.is_on:
                     selected_rooms.append(entity)
 
             # If we have specific rooms selected, use targeted cleaning
@@ -247,62 +236,24 @@ class RoombaVacuum(CoordinatorEntity, StateVacuumEntity):
                     "regions": regions,
                 }
 
-                await self.hass.services.async_call(
-                    DOMAIN,
-                    "rest980_clean",
-                    service_data={
-                        "payload": payload,
-                        "base_url": self._entry.data["base_url"],
-                    },
-                    blocking=True,
-                )
+                await async_send_clean(self.hass, self._entry.data["base_url"], payload)
             else:
                 # No specific rooms selected, start general clean
                 _LOGGER.info("Starting general cleaning (no specific rooms selected)")
-                await self.hass.services.async_call(
-                    DOMAIN,
-                    "rest980_clean",
-                    service_data={
-                        "payload": {"action": "start"},
-                        "base_url": self._entry.data["base_url"],
-                    },
-                    blocking=True,
+                await async_send_clean(
+                    self.hass, self._entry.data["base_url"], {"action": "start"}
                 )
         except (KeyError, AttributeError, ValueError, Exception) as e:
             _LOGGER.error("Failed to start cleaning due to configuration error: %s", e)
 
     async def async_stop(self) -> None:
         """Stop the action."""
-        await self.hass.services.async_call(
-            DOMAIN,
-            "rest980_action",
-            service_data={
-                "action": "stop",
-                "base_url": self._entry.data["base_url"],
-            },
-            blocking=True,
-        )
+        await async_send_action(self.hass, self._entry.data["base_url"], "stop")
 
     async def async_pause(self):
         """Pause the current action."""
-        await self.hass.services.async_call(
-            DOMAIN,
-            "rest980_action",
-            service_data={
-                "action": "pause",
-                "base_url": self._entry.data["base_url"],
-            },
-            blocking=True,
-        )
+        await async_send_action(self.hass, self._entry.data["base_url"], "pause")
 
     async def async_return_to_base(self):
         """Calls the Roomba back to its dock."""
-        await self.hass.services.async_call(
-            DOMAIN,
-            "rest980_action",
-            service_data={
-                "action": "dock",
-                "base_url": self._entry.data["base_url"],
-            },
-            blocking=True,
-        )
\ No newline at end of file
+        await async_send_action(self.hass, self._entry.data["base_url"], "dock")
\ No newline at end of file